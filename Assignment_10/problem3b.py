@@ -1,6 +1,11 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.fft import dst, idst
+import sys
+from pathlib import Path
+# 共用的參考值快取 (common/refCache.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from refCache import cached_reference
 
 def solve_mol_fst_exact(N, T_end):
     """
@@ -42,7 +47,9 @@ def analyze_convergence():
     # 1. 計算參考解 (使用極高解析度)
     print(f"Computing reference solution at T={T_target} (N=2048)...")
     # 注意：T=1時解非常小，需要高精度計算
-    _, u_ref_vals = solve_mol_fst_exact(2048, T_target)
+    u_ref_vals = cached_reference(
+        "A10.problem3b.u_ref", lambda: solve_mol_fst_exact(2048, T_target)[1],
+        pde="u_t=u_xx", u0="sin(2 pi x) exp(x)", N=2048, T=T_target, method="DST exact time")
     
     print(f"{'N':<10} | {'L2 Error':<15} | {'Order':<10}")
     print("-" * 40)
@@ -1,6 +1,8 @@
 import math
 import numpy as np
-from scipy.interpolate import BarycentricInterpolator
+from scipy.fft import dct
+
+from maxNorm import sup_norm
 
 # ---- target function ----
 def f(x):
@@ -15,66 +17,129 @@ def cheb_lobatto_nodes(m: int) -> np.ndarray:
     x = np.cos(np.pi * k / (m - 1))        # from 1 to -1
     return np.sort(x)                      # ascending: [-1,...,1]
 
+# ---- barycentric weights for Lobatto nodes (closed form) ----
+# w_k = (-1)^k, endpoints halved (common factors cancel in the formula)
+def cheb_lobatto_weights(m: int) -> np.ndarray:
+    w = (-1.0) ** np.arange(m)
+    w[0] *= 0.5
+    w[-1] *= 0.5
+    return w
+
+# ---- barycentric evaluation in fixed-size chunks ----
+# y: (m,) values at the nodes, or (m, K) for K data vectors on the same nodes
+# returns p(xs) with shape (len(xs),) or (len(xs), K)
+def bary_eval(x, y, xs, w=None, chunk=4096) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    xs = np.asarray(xs, dtype=float)
+    if w is None:
+        w = cheb_lobatto_weights(len(x))
+    Y = y.reshape(len(x), -1)
+    K = Y.shape[1]
+    YA = np.column_stack([Y, np.ones(len(x))])   # last column gives the denominator
+    out = np.empty((len(xs), K))
+    for i in range(0, len(xs), chunk):
+        d = xs[i:i+chunk, None] - x[None, :]
+        hit = d == 0.0
+        d[hit] = 1.0                       # avoid 0-division; fixed up below
+        np.divide(w, d, out=d)
+        nd = d @ YA
+        out[i:i+chunk] = nd[:, :K] / nd[:, K:]
+        r, c = np.nonzero(hit)             # points landing exactly on a node
+        out[i + r] = Y[c]
+    return out if y.ndim > 1 else out[:, 0]
+
 # ---- max error on dense grid ----
-def max_error(interp, a=-1.0, b=1.0, samples=20001) -> float:
-    xs = np.linspace(a, b, samples)
-    err = np.abs(f(xs) - interp(xs))
-    return float(np.max(err))
+# grid is generated chunk by chunk, so samples=10**7 stays in bounded memory;
+# with a batched interp (K columns) pass fun returning (n, K) -> array of K errors
+def max_error(interp, a=-1.0, b=1.0, samples=20001, fun=f, chunk=1 << 16):
+    err = 0.0
+    for i in range(0, samples, chunk):
+        xs = a + (b - a) * np.arange(i, min(i + chunk, samples)) / (samples - 1)
+        p = interp(xs)
+        fx = fun(xs)
+        err = np.maximum(err, np.max(np.abs(fx - p), axis=0))
+    return float(err) if np.ndim(err) == 0 else err
+
+# ---- Chebyshev coefficients from samples on x_j = cos(pi j / n) ----
+# DCT-I of the Lobatto samples (ordered 1 -> -1), O(n log n)
+def cheb_coeffs(y: np.ndarray) -> np.ndarray:
+    n = len(y) - 1
+    c = dct(y, type=1) / n
+    c[0] *= 0.5
+    c[-1] *= 0.5
+    return c
+
+# ---- adaptive constructor on nested grids n = 2^k ----
+# returns (c, m): Chebyshev coefficients c[0..m-1] and the minimal number of nodes m
+def adaptive_cheb(func, tol=1e-10, k_min=3, k_max=12, verbose=True):
+    n = 2 ** k_min
+    y = func(np.cos(np.pi * np.arange(n + 1) / n))
+    for k in range(k_min, k_max + 1):
+        c = cheb_coeffs(y)
+        # interpolation error of degree d <= 2 * sum_{j>d} |c_j|
+        tail = 2.0 * np.cumsum(np.abs(c[::-1]))[::-1]
+        ok = np.nonzero(np.append(tail[1:], 0.0) < tol)[0]
+        d = int(ok[0])
+        if verbose:
+            print(f"n={n:5d} (k={k:2d})  |c_n|={abs(c[-1]):.3e}  deg estimate={d:4d}")
+        # resolved once the coefficients fell off well before the end of the grid
+        if d <= n // 2:
+            return c[:d + 1], d + 1
+        if k == k_max:
+            break
+        # refine: keep old samples (even indices), evaluate only the new midpoints
+        y_new = np.empty(2 * n + 1)
+        y_new[0::2] = y
+        y_new[1::2] = func(np.cos(np.pi * np.arange(1, 2 * n, 2) / (2 * n)))
+        y, n = y_new, 2 * n
+    return None, None  # not resolved up to 2^k_max + 1 nodes
+
+# ---- adaptive max error: coarse Lobatto-clustered grid + golden-section refinement ----
+# (error extrema of Chebyshev interpolants cluster like the nodes)
+def max_error_adaptive(interp, m, a=-1.0, b=1.0, fun=f):
+    n0 = 4 * (m - 1)
+    x0 = a + 0.5 * (b - a) * (1.0 - np.cos(np.pi * np.arange(n0 + 1) / n0))
+    err, _, nev = sup_norm(lambda xs: fun(xs) - interp(xs), a, b, x0=x0)
+    return err, nev
 
 # ---- search minimal m (nodes) to meet tol ----
-def find_min_nodes(tol=1e-10, m_start=8, m_max=2000, samples=20001, verbose=True):
-    # exponential ramp-up to bracket, then binary search for minimal m
-    def err_for(m):
-        x = cheb_lobatto_nodes(m)
-        y = f(x)
-        itp = BarycentricInterpolator(x, y)
-        return max_error(itp, -1.0, 1.0, samples)
-
-    m = m_start
-    e = err_for(m)
+# check: "adaptive" (sup_norm estimate), "dense" (uniform grid of `samples`), or None
+def find_min_nodes(tol=1e-10, m_start=8, m_max=2000, samples=20001, verbose=True,
+                   check="adaptive"):
+    # degree from the coefficient fall-off, then (optionally) one confirmation
+    k_min = max(1, math.ceil(math.log2(max(m_start - 1, 2))))
+    k_max = max(k_min, math.floor(math.log2(m_max - 1)))
+    c, m = adaptive_cheb(f, tol, k_min, k_max, verbose)
+    if m is None:
+        return None, None  # not found up to m_max
+    if check is None:
+        return m, None
+
+    x = cheb_lobatto_nodes(m)
+    y = f(x)
+    itp = lambda xs: bary_eval(x, y, xs)
+    if check == "dense":
+        e, nev = max_error(itp, -1.0, 1.0, samples), samples
+    else:
+        e, nev = max_error_adaptive(itp, m)
     if verbose:
-        print(f"m={m:4d} (deg={m-1:4d})  max_err={e:.3e}")
-    if e < tol:
-        return m, e
-
-    # grow until error < tol or reach cap
-    prev_m, prev_e = m, e
-    while m < m_max:
-        m = min(2*m, m_max)
-        e = err_for(m)
-        if verbose:
-            print(f"m={m:4d} (deg={m-1:4d})  max_err={e:.3e}")
-        if e < tol:
-            lo, hi = prev_m + 1, m
-            # binary search minimal m in [lo, hi]
-            best_m, best_e = m, e
-            while lo <= hi:
-                mid = (lo + hi) // 2
-                emid = err_for(mid)
-                if verbose and (hi - lo <= 4):
-                    print(f"  check m={mid:4d} -> {emid:.3e}")
-                if emid < tol:
-                    best_m, best_e = mid, emid
-                    hi = mid - 1
-                else:
-                    lo = mid + 1
-            return best_m, best_e
-        prev_m, prev_e = m, e
-
-    return None, None  # not found up to m_max
+        print(f"  check m={m:4d} -> {e:.3e}  ({check}, {nev} evaluations)")
+    return m, e
 
 def main():
     tol = 1e-10
-    samples = 20001   # dense enough to estimate max error
+    samples = 20001   # only used for check="dense"
+    check = "adaptive"
     m_start = 8
     m_max = 4000
 
     print("=== Chebyshev (Lobatto) polynomial interpolation ===")
     print("Function: f(x) = 1 / (1 + 25 x^2) on [-1,1]")
     print(f"Target tolerance      : {tol:.1e}")
-    print(f"Verification samples  : {samples}\n")
+    print(f"Verification          : {check}\n")
 
-    m, err = find_min_nodes(tol, m_start, m_max, samples, verbose=True)
+    m, err = find_min_nodes(tol, m_start, m_max, samples, verbose=True, check=check)
 
     if m is None:
         print("\nNo solution found up to m_max; increase the cap.")
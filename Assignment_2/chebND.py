@@ -0,0 +1,117 @@
+# chebND.py
+# Tensor-product Chebyshev interpolation on [-1,1]^d (d = 2, 3, ...)
+# - samples f on tensor Chebyshev–Lobatto grids, n_i = 2^k_i per axis
+# - coefficients by a d-dimensional DCT-I (scipy.fft.dctn), O(N log N)
+# - degree chosen per axis from the fall-off of that axis' coefficient profile;
+#   only unresolved axes are refined, and old samples are reused
+# - evaluation on a tensor grid by contracting one axis at a time
+
+import numpy as np
+from scipy.fft import dctn
+from numpy.polynomial.chebyshev import chebvander
+
+# ---- 1-D Lobatto points in DCT order: x_j = cos(pi j / n), from 1 to -1 ----
+def lobatto_points(n: int) -> np.ndarray:
+    return np.cos(np.pi * np.arange(n + 1) / n)
+
+# ---- tensor-product nodes (ascending per axis, like cheb_lobatto_nodes) ----
+def cheb_lobatto_grid(ms) -> list:
+    return [lobatto_points(m - 1)[::-1] for m in ms]
+
+# ---- coefficients from samples F[j1, j2, ...] at (x_j1, x_j2, ...) ----
+def cheb_coeffs_nd(F: np.ndarray) -> np.ndarray:
+    C = dctn(F, type=1)
+    for ax, n1 in enumerate(F.shape):
+        n = n1 - 1
+        C /= n
+        idx = [slice(None)] * F.ndim
+        for j in (0, n):
+            idx[ax] = j
+            C[tuple(idx)] *= 0.5
+    return C
+
+def _sample(func, ns):
+    X = np.meshgrid(*[lobatto_points(n) for n in ns], indexing="ij")
+    return func(*X)
+
+# ---- refine one axis: keep old samples (even indices), evaluate the new ones ----
+def _refine_axis(func, F, ns, ax):
+    ns = list(ns)
+    n = ns[ax]
+    pts = [lobatto_points(k) for k in ns]
+    pts[ax] = np.cos(np.pi * np.arange(1, 2 * n, 2) / (2 * n))
+    new = func(*np.meshgrid(*pts, indexing="ij"))
+    shape = list(F.shape)
+    shape[ax] = 2 * n + 1
+    G = np.empty(shape)
+    idx = [slice(None)] * F.ndim
+    idx[ax] = slice(0, None, 2)
+    G[tuple(idx)] = F
+    idx[ax] = slice(1, None, 2)
+    G[tuple(idx)] = new
+    ns[ax] = 2 * n
+    return G, ns
+
+# ---- adaptive constructor ----
+# func(X1, ..., Xd) vectorized on "ij" meshgrids; returns (C, ms) with
+# C of shape ms (ms[i] = number of nodes used along axis i) or (None, None)
+def adaptive_cheb_nd(func, dim=2, tol=1e-10, k_min=3, k_max=10, verbose=True):
+    ns = [2 ** k_min] * dim
+    F = _sample(func, ns)
+    while True:
+        C = cheb_coeffs_nd(F)
+        A = np.abs(C)
+        degs, todo = [], []
+        for ax in range(dim):
+            # axis profile: sum over the other axes; error share 2*tail < tol/dim
+            prof = A.sum(axis=tuple(i for i in range(dim) if i != ax))
+            tail = 2.0 * np.cumsum(prof[::-1])[::-1]
+            d = int(np.nonzero(np.append(tail[1:], 0.0) < tol / dim)[0][0])
+            degs.append(d)
+            if d > ns[ax] // 2:
+                todo.append(ax)
+        if verbose:
+            print(f"n={ns}  deg estimate={degs}")
+        if not todo:
+            return C[tuple(slice(0, d + 1) for d in degs)], [d + 1 for d in degs]
+        for ax in todo:
+            if ns[ax] >= 2 ** k_max:
+                return None, None   # not resolved up to 2^k_max + 1 nodes on this axis
+            F, ns = _refine_axis(func, F, ns, ax)
+
+# ---- evaluate on the tensor grid xs[0] x xs[1] x ... ----
+# p(x) = sum_{j} C[j1,...,jd] T_j1(x1)...T_jd(xd), contracted one axis at a time
+def cheb_eval_grid(C: np.ndarray, *xs) -> np.ndarray:
+    P = C
+    for ax, x in enumerate(xs):
+        V = chebvander(np.asarray(x, dtype=float), C.shape[ax] - 1)  # (len(x), deg+1)
+        P = np.moveaxis(np.tensordot(V, P, axes=([1], [ax])), 0, ax)
+    return P
+
+def main():
+    import time
+    tol = 1e-10
+    runge2 = lambda x, y: 1.0 / (1.0 + 25.0 * (x * x + y * y))
+    print("=== Tensor-product Chebyshev interpolation ===")
+    print("Function: f(x,y) = 1 / (1 + 25 (x^2 + y^2)) on [-1,1]^2")
+    t0 = time.perf_counter()
+    C, ms = adaptive_cheb_nd(runge2, dim=2, tol=tol)
+    t1 = time.perf_counter()
+    xs = np.linspace(-1, 1, 801)
+    err = np.max(np.abs(cheb_eval_grid(C, xs, xs) - runge2(*np.meshgrid(xs, xs, indexing="ij"))))
+    print(f"nodes per axis = {ms}, build {t1 - t0:.3f} s, max error on 801^2 grid = {err:.3e}")
+
+    runge3 = lambda x, y, z: 1.0 / (1.0 + 25.0 * (x * x + y * y + z * z))
+    print("Function: f(x,y,z) = 1 / (1 + 25 (x^2 + y^2 + z^2)) on [-1,1]^3")
+    xs = np.linspace(-1, 1, 101)
+    exact3 = runge3(*np.meshgrid(xs, xs, xs, indexing="ij"))
+    for tol3 in (1e-4, tol):          # ~64^3 surrogate, then the full tolerance
+        t0 = time.perf_counter()
+        C3, ms3 = adaptive_cheb_nd(runge3, dim=3, tol=tol3, verbose=False)
+        t1 = time.perf_counter()
+        err3 = np.max(np.abs(cheb_eval_grid(C3, xs, xs, xs) - exact3))
+        print(f"tol={tol3:.0e}: nodes per axis = {ms3}, build {t1 - t0:.3f} s, "
+              f"max error on 101^3 grid = {err3:.3e}")
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,20 @@
 # spline_verify.py
 # f(x) = 1 / (1 + 25x^2), interval [-1,1]
 # 1) 用公式計算最小 N，對 tol=1e-10, 1e-14
-# 2) 用 scipy 做 natural / clamped cubic spline，驗證實際誤差
+# 2) 用 splineBatch 做 natural / clamped cubic spline，驗證實際誤差
 
 import numpy as np
-import sympy as sp
-from scipy.interpolate import CubicSpline
 
-# --- Step 1: 最大四階導數 ---
-def max_abs_fourth_derivative():
-    x = sp.symbols('x', real=True)
-    f = 1 / (1 + 25*x**2)
-    f4 = sp.simplify(sp.diff(f, x, 4))
-    g = sp.simplify(f4**2)
-    dg = sp.diff(g, x)
-    num, den = sp.together(dg).as_numer_denom()
-    roots = sp.nroots(sp.Poly(num, x))
+from derivBound import max_abs_derivative
+from maxNorm import sup_norm
+from splineBatch import fit_splines, spline_eval
 
-    cand = {-1.0, 0.0, 1.0}
-    for r in roots:
-        if abs(sp.im(r)) < 1e-12:
-            val = float(sp.re(r))
-            if -1.0 <= val <= 1.0:
-                cand.add(val)
+def f(x):
+    return 1 / (1 + 25*x**2)
 
-    f4_np = sp.lambdify(x, f4, "numpy")
-    M = max(abs(float(f4_np(c))) for c in cand)
-    return float(M), f4
+# --- Step 1: 最大四階導數 (數值: Chebyshev 展開 + 譜微分，結果快取於 .cache/) ---
+def max_abs_fourth_derivative(func=f, a=-1.0, b=1.0):
+    return max_abs_derivative(func, 4, a, b)
 
 # --- Step 2: 公式計算最小 N ---
 def minimal_N_for_tol(M, tol):
@@ -34,29 +22,25 @@ def minimal_N_for_tol(M, tol):
     return int(np.ceil(2 * ((const / tol) ** 0.25)))
 
 # --- Step 3: 驗證誤差 ---
+# f'(x) = -50x / (1+25x^2)^2  (clamped 端點斜率)
+def fprime(x):
+    return -50*x / (1 + 25*x**2)**2
+
 def verify_spline(N, bc_type="natural"):
-    f = lambda x: 1 / (1 + 25*x**2)
+    # 三對角矩陣的 LU 依 (knots, bc_type) 快取於 splineBatch
     x_nodes = np.linspace(-1, 1, N+1)
     y_nodes = f(x_nodes)
+    spline = fit_splines(x_nodes, y_nodes, bc_type, fprime(-1.0), fprime(1.0))
 
-    if bc_type == "natural":
-        spline = CubicSpline(x_nodes, y_nodes, bc_type="natural")
-    elif bc_type == "clamped":
-        # f'(x) = -50x / (1+25x^2)^2
-        fprime = lambda x: -50*x / (1 + 25*x**2)**2
-        spline = CubicSpline(x_nodes, y_nodes,
-                             bc_type=((1, fprime(-1)), (1, fprime(1))))
-    else:
-        raise ValueError("bc_type must be 'natural' or 'clamped'")
-
-    # dense grid for error check
-    x_dense = np.linspace(-1, 1, 5001)
-    err = np.max(np.abs(f(x_dense) - spline(x_dense)))
+    # 自適應誤差估計: 粗網格 + golden-section 細化
+    # 誤差在每個區間振盪一次 (節點上為 0)，所以粗網格取所有節點和區間中點 (O(N))，
+    # 每個 bracket 只涵蓋一個區間
+    x0 = np.linspace(-1, 1, 2*N + 1)
+    err, _, _ = sup_norm(lambda x: f(x) - spline_eval(spline, x), -1.0, 1.0, x0=x0)
     return err
 
 def main():
-    M, f4 = max_abs_fourth_derivative()
-    print("f''''(x) =", f4)
+    M = max_abs_fourth_derivative()
     print(f"max |f''''(x)| = {M:.6f}\n")
 
     for tol in [1e-10, 1e-14]:
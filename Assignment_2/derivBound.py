@@ -0,0 +1,140 @@
+# derivBound.py
+# Numeric bound for max |f^(k)(x)| on [a,b], replacing the sympy pipeline
+# (diff -> simplify -> nroots -> lambdify) in cubicSpline.py.
+# 1) Chebyshev expansion of f on [a,b] (adaptive, DCT-based, see Chebysehv.py)
+# 2) spectral differentiation of the coefficients
+# 3) candidates = endpoints + real roots of f^(k+1) in [a,b] (+ a dense check)
+# Results are cached on disk through common/refCache, keyed by (function, k, a, b).
+
+import hashlib
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+from numpy.polynomial import chebyshev as C
+
+from Chebysehv import cheb_coeffs
+# 共用的參考值快取 (common/refCache.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from refCache import cached_reference
+
+# ---- cache key: function identity ----
+# Automatic keys only for plain Python functions (and numpy ufuncs): bytecode +
+# constants (nested code included) + defaults + closure cell values + the
+# current values of every global it reads, so closures such as
+# make(a) = lambda x: 1/(1+a*x**2) get one key per a. Captured values must be
+# plain data, arrays, modules, ufuncs or such functions; anything else
+# (partial, np.vectorize, splines, callable objects) has state we cannot hash,
+# so func_key returns None and the bound is not cached unless key= is given.
+_PLAIN = (type(None), bool, int, float, complex, str, bytes, np.generic)
+
+class _Unkeyable(Exception):
+    pass
+
+def _code_sig(code) -> bytes:
+    parts = [code.co_code, repr(code.co_names).encode()]
+    for c in code.co_consts:
+        parts.append(_code_sig(c) if isinstance(c, types.CodeType) else repr(c).encode())
+    return b"|".join(parts)
+
+def _code_names(code) -> set:
+    names = set(code.co_names)
+    for c in code.co_consts:
+        if isinstance(c, types.CodeType):
+            names |= _code_names(c)
+    return names
+
+def _value_sig(v, seen) -> str:
+    if isinstance(v, _PLAIN):
+        return repr(v)
+    if isinstance(v, (tuple, list, frozenset)):
+        items = sorted(_value_sig(x, seen) for x in v) if isinstance(v, frozenset) else \
+            [_value_sig(x, seen) for x in v]
+        return f"{type(v).__name__}({','.join(items)})"
+    if isinstance(v, dict):
+        return "dict(" + ",".join(sorted(f"{_value_sig(k, seen)}:{_value_sig(x, seen)}"
+                                         for k, x in v.items())) + ")"
+    if isinstance(v, np.ndarray):
+        if v.dtype == object:
+            raise _Unkeyable(v)
+        return f"array:{v.shape}:{v.dtype}:{hashlib.sha1(np.ascontiguousarray(v).tobytes()).hexdigest()}"
+    if isinstance(v, types.ModuleType):
+        return f"module:{v.__name__}"
+    if isinstance(v, np.ufunc):
+        return f"ufunc:{v.__name__}"
+    if isinstance(v, types.FunctionType):
+        return _function_sig(v, seen)
+    raise _Unkeyable(v)
+
+def _function_sig(func, seen) -> str:
+    name = f"{func.__module__}.{func.__qualname__}"
+    if id(func) in seen:               # recursion / mutual references
+        return name
+    seen.add(id(func))
+    code = func.__code__
+    h = hashlib.sha1(_code_sig(code))
+    h.update(_value_sig(func.__defaults__, seen).encode())
+    h.update(_value_sig(func.__kwdefaults__, seen).encode())
+    for cell in func.__closure__ or ():
+        try:
+            v = cell.cell_contents
+        except ValueError:             # empty cell
+            h.update(b"<empty>")
+            continue
+        h.update(_value_sig(v, seen).encode())
+    g = func.__globals__
+    for n in sorted(_code_names(code)):
+        if n in g:
+            h.update(f"{n}={_value_sig(g[n], seen)}".encode())
+    return f"{name}:{h.hexdigest()[:16]}"
+
+def func_key(func):
+    """Cache key for func, or None if its identity cannot be hashed (pass key=)."""
+    if isinstance(func, np.ufunc):
+        return f"ufunc:{func.__name__}"
+    if not isinstance(func, types.FunctionType):
+        return None
+    try:
+        return _function_sig(func, set())
+    except _Unkeyable:
+        return None
+
+# ---- Chebyshev coefficients of f on [a,b] (to ~machine precision) ----
+# double n until the last quarter of the coefficients sits at rounding level,
+# then chop the noise plateau
+def cheb_expand(func, a=-1.0, b=1.0, n_max=1 << 14) -> np.ndarray:
+    mid, half = 0.5 * (a + b), 0.5 * (b - a)
+    n = 16
+    while n <= n_max:
+        y = func(mid + half * np.cos(np.pi * np.arange(n + 1) / n))
+        c = cheb_coeffs(y)
+        floor = 1e-14 * max(np.max(np.abs(y)), 1e-300)
+        if np.max(np.abs(c[-(n // 4):])) < floor:
+            keep = np.nonzero(np.abs(c) > 0.1 * floor)[0]
+            return c[:keep[-1] + 1] if len(keep) else c[:1]
+        n *= 2
+    raise ValueError("f is not resolved by a Chebyshev expansion on [a,b]")
+
+# ---- max |f^(k)| on [a,b] ----
+def _max_abs_derivative(func, k, a, b) -> float:
+    c = cheb_expand(func, a, b)
+    dk = C.chebder(c, k) * (2.0 / (b - a)) ** k      # chain rule for x = mid + half*t
+    # extrema of f^(k): endpoints and real roots of f^(k+1) inside [-1,1]
+    r = C.chebroots(C.chebder(dk)) if len(dk) > 2 else np.array([])
+    r = r[np.abs(r.imag) < 1e-10].real
+    cand = np.concatenate(([-1.0, 1.0], r[np.abs(r) <= 1.0],
+                           np.cos(np.pi * np.arange(2001) / 2000)))
+    return float(np.max(np.abs(C.chebval(cand, dk))))
+
+def max_abs_derivative(func, k=4, a=-1.0, b=1.0, use_cache=True, key=None) -> float:
+    """
+    max |f^(k)| on [a,b]; key overrides the automatic func_key(func).
+    Without key=, callables that func_key cannot identify are not cached.
+    """
+    key = func_key(func) if key is None else key
+    if not use_cache or key is None:
+        return _max_abs_derivative(func, k, a, b)
+    return float(cached_reference("A2.derivBound.max_abs",
+                                  lambda: _max_abs_derivative(func, k, a, b),
+                                  func=key, k=k, interval=[float(a), float(b)]))
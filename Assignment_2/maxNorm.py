@@ -0,0 +1,62 @@
+# maxNorm.py
+# Adaptive estimate of max_{x in [a,b]} |e(x)|, e.g. e = f - p.
+# 1) sample |e| on a coarse grid
+# 2) take the largest local maxima (endpoints included)
+# 3) refine each one inside its bracket [x_{i-1}, x_{i+1}] with golden-section
+#    search, all brackets advanced together (one vectorized call per iteration)
+# Returns the estimate, where it is attained, and the number of e-evaluations.
+# The coarse grid must resolve the oscillation of e: each bracket should hold
+# a single local maximum (e.g. for a spline error, one point per knot interval),
+# otherwise the search settles on an arbitrary local peak.
+
+import numpy as np
+
+GOLD = (np.sqrt(5.0) - 1.0) / 2.0   # 0.618...
+
+def sup_norm(e, a=-1.0, b=1.0, n0=257, top=8, xtol=None, x0=None):
+    """
+    e   : vectorized error function, e(xs) -> array
+    n0  : coarse grid size (uniform), ignored if the grid x0 is given; the
+          default 257 only suits e with a few dozen oscillations on [a,b]
+    top : number of local maxima refined
+    xtol: bracket width at which the search stops (default 1e-8 (b-a))
+    returns (max|e|, x_max, n_evals)
+    """
+    xs = np.linspace(a, b, n0) if x0 is None else np.asarray(x0, dtype=float)
+    ys = np.abs(e(xs))
+    nev = len(xs)
+    if xtol is None:
+        xtol = 1e-8 * (b - a)
+
+    # local maxima of the coarse samples (plateaus count once)
+    pad = np.concatenate(([-np.inf], ys, [-np.inf]))
+    peak = np.nonzero((pad[1:-1] >= pad[:-2]) & (pad[1:-1] > pad[2:]))[0]
+    peak = peak[np.argsort(ys[peak])[::-1][:top]]
+
+    best = int(np.argmax(ys))
+    best_y, best_x = float(ys[best]), float(xs[best])
+
+    lo = xs[np.maximum(peak - 1, 0)]
+    hi = xs[np.minimum(peak + 1, len(xs) - 1)]
+    c = hi - GOLD * (hi - lo)
+    d = lo + GOLD * (hi - lo)
+    fcd = np.abs(e(np.concatenate((c, d))))
+    fc, fd = fcd[:len(c)], fcd[len(c):]
+    nev += 2 * len(c)
+    while len(c) and np.max(hi - lo) > xtol:
+        left = fc > fd                 # max lies in [lo, d]
+        hi = np.where(left, d, hi)
+        lo = np.where(left, lo, c)
+        new = np.where(left, hi - GOLD * (hi - lo), lo + GOLD * (hi - lo))
+        fnew = np.abs(e(new))
+        nev += len(new)
+        c, d = np.where(left, new, d), np.where(left, c, new)
+        fc, fd = np.where(left, fnew, fd), np.where(left, fc, fnew)
+
+    if len(c):
+        cand_x = np.concatenate((c, d))
+        cand_y = np.concatenate((fc, fd))
+        k = int(np.argmax(cand_y))
+        if cand_y[k] > best_y:
+            best_y, best_x = float(cand_y[k]), float(cand_x[k])
+    return best_y, best_x, nev
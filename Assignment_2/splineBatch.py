@@ -0,0 +1,141 @@
+# splineBatch.py
+# Cubic splines on a FIXED knot vector for many data columns at once.
+# The tridiagonal moment system (M_i = S''(x_i)) is LU-factored once per
+# (knots, bc_type) with LAPACK ?gttrf and reused for every right-hand side
+# matrix via ?gttrs, so K curves cost one O(nK) solve instead of K setups.
+# bc_type: "natural", "clamped" (S' given at both ends), "not-a-knot".
+
+import numpy as np
+from scipy.interpolate import PPoly
+from scipy.linalg.lapack import dgttrf, dgttrs
+
+BC_TYPES = ("natural", "clamped", "not-a-knot")
+
+class SplineFactor:
+    def __init__(self, x, bc_type="natural"):
+        """
+        Factor the moment system for knots x (strictly increasing).
+        natural    : unknowns M_1..M_{n-1}, M_0 = M_n = 0
+        clamped    : unknowns M_0..M_n, rows 0 and n from S'(x_0), S'(x_n)
+        not-a-knot : unknowns M_1..M_{n-1}, M_0 and M_n eliminated with
+                     S''' continuous at x_1 and x_{n-1}
+        """
+        if bc_type not in BC_TYPES:
+            raise ValueError(f"bc_type must be one of {BC_TYPES}")
+        x = np.asarray(x, dtype=float)
+        n = len(x) - 1
+        if n < (3 if bc_type == "not-a-knot" else 2):
+            raise ValueError("too few knots for this boundary condition")
+        h = np.diff(x)
+        if np.any(h <= 0):
+            raise ValueError("knots must be strictly increasing")
+        self.x, self.h, self.n, self.bc_type = x, h, n, bc_type
+
+        # interior rows i=1..n-1: h_{i-1} M_{i-1} + 2(h_{i-1}+h_i) M_i + h_i M_{i+1}
+        d = 2.0 * (h[:-1] + h[1:])
+        dl = h[1:-1].copy()            # sub-diagonal (coefficient of M_{i-1})
+        du = h[1:-1].copy()            # super-diagonal (coefficient of M_{i+1})
+        if bc_type == "clamped":
+            d = np.concatenate(([2.0 * h[0]], d, [2.0 * h[-1]]))
+            dl, du = h.copy(), h.copy()
+        elif bc_type == "not-a-knot":
+            r0, r1 = h[0] / h[1], h[-1] / h[-2]
+            # M_0 = (1+r0) M_1 - r0 M_2,  M_n = (1+r1) M_{n-1} - r1 M_{n-2}
+            d[0] += h[0] * (1.0 + r0)
+            du[0] -= h[0] * r0
+            d[-1] += h[-1] * (1.0 + r1)
+            dl[-1] -= h[-1] * r1
+
+        if len(d) < 3:
+            # scipy's ?gttrf wrapper needs at least 3 unknowns (3-knot natural,
+            # 4-knot not-a-knot): keep the 1x1 / 2x2 system and solve it directly
+            self.lu, self.A = None, np.diag(d) + np.diag(dl, -1) + np.diag(du, 1)
+            return
+        *self.lu, info = dgttrf(dl, d, du)   # lu = (dl, d, du, du2, ipiv)
+        if info != 0:
+            raise np.linalg.LinAlgError("singular spline system")
+
+    def moments(self, Y, dy0=0.0, dyn=0.0) -> np.ndarray:
+        """Solve for M (n+1, K) for data Y (n+1, K); dy0/dyn only for clamped (scalar or (K,))."""
+        h, n = self.h, self.n
+        delta = np.diff(Y, axis=0) / h[:, None]             # slopes, (n, K)
+        rhs = 6.0 * (delta[1:] - delta[:-1])                # interior rows, (n-1, K)
+        if self.bc_type == "clamped":
+            rhs = np.vstack([6.0 * (delta[0] - np.asarray(dy0, dtype=float)),
+                             rhs,
+                             6.0 * (np.asarray(dyn, dtype=float) - delta[-1])])
+        if self.lu is None:
+            sol = np.linalg.solve(self.A, rhs)
+        else:
+            sol, info = dgttrs(*self.lu, rhs)
+            if info != 0:
+                raise np.linalg.LinAlgError("spline solve failed")
+        if self.bc_type == "clamped":
+            return sol
+        M = np.zeros((n + 1, Y.shape[1]))
+        M[1:n] = sol
+        if self.bc_type == "not-a-knot":
+            r0, r1 = h[0] / h[1], h[-1] / h[-2]
+            M[0] = (1.0 + r0) * M[1] - r0 * M[2]
+            M[n] = (1.0 + r1) * M[n-1] - r1 * M[n-2]
+        return M
+
+    def fit(self, Y, dy0=0.0, dyn=0.0) -> PPoly:
+        """Spline(s) through Y: (n+1,) -> scalar-valued, (n+1, K) -> K-valued PPoly."""
+        Y = np.asarray(Y, dtype=float)
+        Y2 = Y.reshape(self.n + 1, -1)
+        M = self.moments(Y2, dy0, dyn)
+        h = self.h[:, None]
+        c = np.empty((4, self.n, Y2.shape[1]))
+        c[0] = (M[1:] - M[:-1]) / (6.0 * h)
+        c[1] = 0.5 * M[:-1]
+        c[2] = (Y2[1:] - Y2[:-1]) / h - h * (2.0 * M[:-1] + M[1:]) / 6.0
+        c[3] = Y2[:-1]
+        return PPoly(c if Y.ndim > 1 else c[..., 0], self.x, extrapolate=True)
+
+# ---- factorization cache: one LU per (knots, bc_type) ----
+_factors = {}
+
+def spline_factor(x, bc_type="natural") -> SplineFactor:
+    x = np.ascontiguousarray(x, dtype=float)
+    key = (x.tobytes(), bc_type)
+    if key not in _factors:
+        _factors[key] = SplineFactor(x, bc_type)
+    return _factors[key]
+
+def fit_splines(x, Y, bc_type="natural", dy0=0.0, dyn=0.0) -> PPoly:
+    return spline_factor(x, bc_type).fit(Y, dy0, dyn)
+
+# ---- evaluation: O(1) interval lookup on uniform knots, Horner form ----
+def uniform_step(x, rtol=1e-12):
+    """Return h if the knots are uniform (x_i = x_0 + i h up to rtol), else None."""
+    h = (x[-1] - x[0]) / (len(x) - 1)
+    return h if np.max(np.abs(np.diff(x) - h)) <= rtol * abs(h) else None
+
+def spline_eval(pp, xs, out=None) -> np.ndarray:
+    """
+    Evaluate a cubic PPoly (e.g. from fit_splines) at xs.
+    Uniform knots: interval index = floor((xs - x_0)/h); otherwise searchsorted.
+    out: optional preallocated array of shape xs.shape + pp.c.shape[2:].
+    """
+    x, c = pp.x, pp.c
+    xs = np.asarray(xs, dtype=float)
+    n = len(x) - 1
+    h = uniform_step(x)
+    if h is not None:
+        i = np.floor((xs - x[0]) * (1.0 / h)).astype(np.intp)
+    else:
+        i = np.searchsorted(x, xs, side="right") - 1
+    np.clip(i, 0, n - 1, out=i)
+    t = xs - np.take(x, i)
+    if c.ndim > 2:
+        t = t.reshape(t.shape + (1,) * (c.ndim - 2))
+    if out is None:
+        out = np.empty(xs.shape + c.shape[2:])
+    # Horner: ((c0 t + c1) t + c2) t + c3
+    np.multiply(np.take(c[0], i, axis=0), t, out=out)
+    for k in range(1, 4):
+        out += np.take(c[k], i, axis=0)
+        if k < 3:
+            out *= t
+    return out
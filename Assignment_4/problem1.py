@@ -3,9 +3,13 @@
 # absolute error vs. step size h, and overlay an O(h^2) reference line.
 
 import math
+import os
 import numpy as np
 import matplotlib.pyplot as plt
 
+from quadrature import trap_levels, romberg_levels, trap_stream, QuadPool
+from doubleExp import de_quad
+
 # True value
 true_val = math.pi / 10.0
 
@@ -15,47 +19,71 @@ true_val = math.pi / 10.0
 def f_t(t: np.ndarray) -> np.ndarray:
     return 1.0 / ((1.0 - t)**2 + 25.0 * t**2)
 
-def trap_integral_on_unit(N: int) -> float:
-    h = 1.0 / (N - 1)
-    t = np.linspace(0.0, 1.0, N)
-    vals = f_t(t)
-    s = 0.5 * (vals[0] + vals[-1]) + vals[1:-1].sum()
-    return h * s
-
-# Build N sequence by doubling subinterval count: N -> 2*(N-1)+1
-Ns = []
-hs = []
-errs = []
-approxs = []
+# Original integrand on [0, inf), for the exp-sinh rule (no substitution needed)
+def f_x(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + 25.0 * x**2)
 
-N = 2000  # starting nodes
+N0 = 2000  # starting nodes
 tol = 1e-12  # compute a bit beyond 1e-10 to show slope clearly
-while True:
-    approx = trap_integral_on_unit(N)
-    err = abs(approx - true_val)
-    h = 1.0 / (N - 1)
-    Ns.append(N); hs.append(h); errs.append(err); approxs.append(approx)
-    if err <= tol or N > 200000:
-        break
-    N = 2 * (N - 1) + 1
-
-# Build O(h^2) reference line passing through the first point
-C = errs[0] / (hs[0]**2)
-ref = [C * (h**2) for h in hs]
-
-# Plot: error vs h (log-log), with O(h^2) reference
-plt.figure()
-plt.loglog(hs, errs, marker='o', label='Trapezoidal error')
-plt.loglog(hs, ref, linestyle='--', label='$\mathcal{O}(h^2)$ reference')
-plt.gca().invert_xaxis()  # smaller h to the right
-plt.xlabel('Step size $h=1/(N-1)$')
-plt.ylabel('Absolute error')
-plt.title('Convergence of Composite Trapezoidal Rule (x = t/(1-t))')
-plt.legend()
-plt.grid(True, which='both')
-plt.show()
-
-# Also print the table
-print(f"{'N(nodes)':>10}  {'h':>14}  {'Approximation':>20}  {'Abs. Error':>12}")
-for N, h, a, e in zip(Ns, hs, approxs, errs):
-    print(f"{N:10d}  {h:14.12f}  {a:20.15f}  {e:12.3e}")
+
+def main():
+    # Build N sequence by doubling subinterval count: N -> 2*(N-1)+1
+    Ns = []
+    hs = []
+    errs = []
+    approxs = []
+
+    # worker processes for the level sums; each owns a contiguous block of nodes
+    # (created here, not at import, so spawned workers can re-import this module)
+    workers = os.cpu_count()
+    pool = QuadPool(f_t, workers)
+    # nested levels: only the new midpoints are evaluated at each doubling
+    for N, h, approx in trap_levels(f_t, 0.0, 1.0, N0, pool=pool):
+        err = abs(approx - true_val)
+        Ns.append(N); hs.append(h); errs.append(err); approxs.append(approx)
+        if err <= tol or N > 200000:
+            break
+
+    # Build O(h^2) reference line passing through the first point
+    C = errs[0] / (hs[0]**2)
+    ref = [C * (h**2) for h in hs]
+
+    # Plot: error vs h (log-log), with O(h^2) reference
+    plt.figure()
+    plt.loglog(hs, errs, marker='o', label='Trapezoidal error')
+    plt.loglog(hs, ref, linestyle='--', label='$\mathcal{O}(h^2)$ reference')
+    plt.gca().invert_xaxis()  # smaller h to the right
+    plt.xlabel('Step size $h=1/(N-1)$')
+    plt.ylabel('Absolute error')
+    plt.title('Convergence of Composite Trapezoidal Rule (x = t/(1-t))')
+    plt.legend()
+    plt.grid(True, which='both')
+    plt.show()
+
+    # Also print the table
+    print(f"{'N(nodes)':>10}  {'h':>14}  {'Approximation':>20}  {'Abs. Error':>12}")
+    for N, h, a, e in zip(Ns, hs, approxs, errs):
+        print(f"{N:10d}  {h:14.12f}  {a:20.15f}  {e:12.3e}")
+
+    # Romberg / Richardson extrapolation on the same nested trapezoid levels
+    print("\nRomberg (from N=2 nodes):")
+    print(f"{'N(nodes)':>10}  {'h':>14}  {'Approximation':>20}  {'Abs. Error':>12}")
+    for N, h, a, _ in romberg_levels(f_t, 0.0, 1.0, 2):
+        e = abs(a - true_val)
+        print(f"{N:10d}  {h:14.12f}  {a:20.15f}  {e:12.3e}")
+        if e <= tol or N > 200000:
+            break
+
+    # Single large-N streaming run: memory stays at one block, report throughput
+    N_big = 10**8 + 1
+    I_big, rate = trap_stream(f_t, 0.0, 1.0, N_big, pool=pool)
+    print(f"\nStreaming trapezoid, N={N_big}, {workers} workers: "
+          f"error {abs(I_big - true_val):.3e}, {rate:.3e} nodes/s")
+    pool.close()
+
+    # exp-sinh directly on [0, inf), stopping on its own error estimate
+    I_de, est_de, nev_de = de_quad(f_x, 0.0, np.inf, tol=tol)
+    print(f"exp-sinh: I={I_de:.15f}  est={est_de:.2e}  err={abs(I_de - true_val):.3e}  evals={nev_de}")
+
+if __name__ == "__main__":
+    main()
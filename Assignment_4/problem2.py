@@ -7,8 +7,17 @@
 import numpy as np
 import mpmath as mp
 import math
+import time
 import matplotlib.pyplot as plt
 
+from quadrature import trap_levels, romberg_levels
+from doubleExp import de_quad
+import sys
+from pathlib import Path
+# 共用的參考值快取 (common/refCache.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from refCache import cached_reference
+
 mp.mp.dps = 70  # higher precision for the reference integral
 
 def f_orig(x: float):
@@ -21,34 +30,43 @@ def g_trans(x: float):
         return -1.0
     return -0.2 * mp.atan(5 * x) / x
 
-# High-precision reference
-I_true = mp.quad(lambda t: f_orig(t), [0, 1])
+# Original integrand, vectorized (for the double-exponential rule, which never
+# evaluates x=0)
+def f_orig_np(x: np.ndarray) -> np.ndarray:
+    return np.log(x) / (1.0 + 25.0 * x * x)
+
+# Vectorized float64 version for the trapezoid sums (mpmath only for the reference).
+# atan(5x)/x has no cancellation for x != 0; the x=0 limit is -0.2*5 = -1.
+def g_trans_np(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    out = np.full(x.shape, -1.0)
+    nz = x != 0.0
+    out[nz] = -0.2 * np.arctan(5.0 * x[nz]) / x[nz]
+    return out
 
-# Composite trapezoid on [0,1] with N nodes
-def trap_integral(N: int) -> float:
-    a, b = 0.0, 1.0
-    x = np.linspace(a, b, N)
-    h = (b - a) / (N - 1)
-    gvals = np.array([float(g_trans(xi)) for xi in x])
-    s = 0.5 * (gvals[0] + gvals[-1]) + gvals[1:-1].sum()
-    return float(h * s)
+# High-precision reference (cached on disk; stored as a string to keep all digits)
+I_true = mp.mpf(cached_reference(
+    "A4.problem2.I_true", lambda: mp.nstr(mp.quad(lambda t: f_orig(t), [0, 1]), mp.mp.dps),
+    integrand="log(x)/(1+25x^2)", interval=[0, 1], method="mp.quad", dps=mp.mp.dps))
 
 # Search for N that achieves error <= 1e-10
 tol = 1e-10
 N0 = 2000  # starting from user's original request
 Ns = []
 errs = []
+times = []
 
-N = N0
-while True:
-    I_trap = trap_integral(N)
+# double the number of subintervals ⇒ double (N-1) and add 1 for nodes;
+# the nested levels only evaluate the new midpoints
+t0 = time.perf_counter()
+for N, h, I_trap in trap_levels(g_trans_np, 0.0, 1.0, N0):
+    times.append(time.perf_counter() - t0)
     err = abs(I_trap - float(I_true))
     Ns.append(N)
     errs.append(err)
     if err <= tol:
         break
-    # double the number of subintervals ⇒ double (N-1) and add 1 for nodes
-    N = 2 * (N - 1) + 1
+    t0 = time.perf_counter()
 
 # Report best result
 print("High-precision (mpmath):", mp.nstr(I_true, 25))
@@ -58,6 +76,28 @@ print(f"  h (step size)  : {1.0/(N-1):.12f}")
 print(f"  Trapezoid      : {I_trap:.15f}")
 print(f"  Absolute error : {err:.3e}")
 
+# Timing per doubling level
+# (level k evaluates only its new nodes: N_0 at the start, then N_{k-1}-1)
+print(f"\n{'N(nodes)':>10}  {'Abs. Error':>12}  {'time [s]':>10}  {'nodes/s':>10}")
+for k, (n_, e_, t_) in enumerate(zip(Ns, errs, times)):
+    n_new = n_ if k == 0 else Ns[k-1] - 1
+    print(f"{n_:10d}  {e_:12.3e}  {t_:10.4f}  {n_new / max(t_, 1e-12):10.3e}")
+print(f"total trapezoid time: {sum(times):.4f} s")
+
+# Romberg / Richardson extrapolation on the nested trapezoid levels
+print("\nRomberg (from N=2 nodes):")
+for N_r, h_r, I_r, _ in romberg_levels(g_trans_np, 0.0, 1.0, 2):
+    err_r = abs(I_r - float(I_true))
+    print(f"  N={N_r:7d}  h={h_r:.3e}  I={I_r:.15f}  err={err_r:.3e}")
+    if err_r <= tol:
+        break
+
+# tanh-sinh on the ORIGINAL integrand log(x)/(1+25x^2): handles the log
+# singularity at 0 directly and stops on its own error estimate
+I_de, est_de, nev_de = de_quad(f_orig_np, 0.0, 1.0, tol=tol)
+print(f"\ntanh-sinh: I={I_de:.15f}  est={est_de:.2e}  "
+      f"err={abs(I_de - float(I_true)):.3e}  evals={nev_de}")
+
 # Plot convergence of error vs N (log-log)
 plt.figure()
 plt.loglog(Ns, errs, marker='o')
@@ -0,0 +1,171 @@
+# autoEuler.py
+# Fixed-step Euler that picks Forward or Backward Euler per step.
+# - stiffness estimate: spectral radius rho of J = df/dy at (t_k, y_k);
+#   scalar -> |J|, systems -> power iteration (on jac(t, y) or matrix-free on
+#   finite-difference J*v), warm-started from the previous dominant vector
+# - FE is (linearly) stable while h*rho <= 2; switch to BE when
+#   h*rho > 2*SAFETY, back to FE when h*rho < 2*SAFETY*HYST
+# - BE: Newton on z - y - h f(t+h, z) = 0 with M = I - h J kept LU-factored;
+#   the factorization is reused across iterations and steps and only rebuilt
+#   when Newton stalls or h*rho has drifted by more than 20%
+# - every step's method is recorded ('E' explicit / 'I' implicit)
+
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+
+from eulerTrace import time_grid
+
+SAFETY = 0.9
+HYST = 0.8
+EPS = np.finfo(float).eps
+
+def fd_jacobian(fun, t, y, fy):
+    """Dense forward-difference Jacobian, one f-evaluation per column."""
+    J = np.empty((len(y), len(y)))
+    for j in range(len(y)):
+        d = np.sqrt(EPS) * max(1.0, abs(y[j]))
+        yp = y.copy()
+        yp[j] += d
+        J[:, j] = (fun(t, yp) - fy) / d
+    return J
+
+def spectral_radius(matvec, v0, iters: int = 20, rtol: float = 1e-2):
+    """Power iteration for |lambda_max|; returns (rho, v, number of matvecs)."""
+    v = v0 / np.linalg.norm(v0)
+    rho = 0.0
+    for it in range(1, iters + 1):
+        w = matvec(v)
+        nw = np.linalg.norm(w)
+        if nw == 0.0:
+            return 0.0, v, it
+        rho_old, rho, v = rho, nw, w / nw
+        if abs(rho - rho_old) <= rtol * rho:
+            break
+    return rho, v, it
+
+def auto_euler(f, h: float, t_end: float, y0, jac=None, newton_tol: float = 1e-10,
+               max_newton: int = 8, power_iters: int = 20):
+    """Integrate y' = f(t, y) on [0, t_end] with step h, switching FE/BE by stiffness.
+
+    Returns ts, ys, methods (array of 'E'/'I', one per step) and a stats dict.
+    """
+    scalar = np.ndim(y0) == 0
+    fun = (lambda t, y: np.atleast_1d(f(t, y[0]))) if scalar else \
+          (lambda t, y: np.asarray(f(t, y), dtype=float))
+    if jac is None:
+        jacobian = lambda t, y, fy: fd_jacobian(fun, t, y, fy)
+    else:
+        jacobian = lambda t, y, fy: np.atleast_2d(np.asarray(jac(t, y[0] if scalar else y),
+                                                             dtype=float))
+    ts = time_grid(h, t_end)
+    y = np.atleast_1d(np.asarray(y0, dtype=float)).copy()
+    ys = np.empty((len(ts), len(y)))
+    ys[0] = y
+    methods = np.empty(len(ts) - 1, dtype="U1")
+    stats = dict(nfev=0, njev=0, nlu=0, nnewton=0, nmatvec=0)
+    v = np.random.default_rng(0).standard_normal(len(y))   # 避免與特徵向量正交
+    implicit = False
+    lu, hr_lu = None, 0.0
+
+    def rho_at(t, y, fy):
+        nonlocal v
+        if jac is not None:
+            J = jacobian(t, y, fy)
+            stats["njev"] += 1
+            if len(y) == 1:
+                return abs(J[0, 0])
+            matvec = lambda u: J @ u
+        else:
+            def matvec(u):     # J u ≈ (f(y + d u) - f(y)) / d
+                d = np.sqrt(EPS) * max(1.0, np.linalg.norm(y))
+                return (fun(t, y + d * u) - fy) / d
+        rho, v, m = spectral_radius(matvec, v, power_iters)
+        stats["nmatvec"] += m
+        if jac is None:
+            stats["nfev"] += m
+        return rho
+
+    def factor(t, z, hr):
+        nonlocal lu, hr_lu
+        fz = fun(t, z)
+        stats["nfev"] += 1
+        J = jacobian(t, z, fz)
+        stats["njev"] += 1
+        if jac is None:
+            stats["nfev"] += len(z)
+        lu, hr_lu = lu_factor(np.eye(len(z)) - h * J), hr
+        stats["nlu"] += 1
+
+    def newton(t1, y, z):
+        dz_old = None
+        for _ in range(max_newton):
+            g = z - y - h * fun(t1, z)
+            stats["nfev"] += 1
+            stats["nnewton"] += 1
+            dz = lu_solve(lu, g)
+            z = z - dz
+            ndz = np.linalg.norm(dz)
+            if ndz <= newton_tol * (1.0 + np.linalg.norm(z)):
+                return z, True
+            if dz_old is not None and ndz > 0.5 * dz_old:    # 收斂太慢: Jacobian 過期
+                return z, False
+            dz_old = ndz
+        return z, False
+
+    for k in range(len(ts) - 1):
+        t, t1 = ts[k], ts[k+1]
+        fy = fun(t, y)
+        stats["nfev"] += 1
+        hr = h * rho_at(t, y, fy)
+        if not implicit and hr > 2.0 * SAFETY:
+            implicit = True
+        elif implicit and hr < 2.0 * SAFETY * HYST:
+            implicit = False
+
+        if implicit:
+            z0 = y + h * fy
+            if lu is None or abs(hr - hr_lu) > 0.2 * hr_lu:     # 剛性估計變化大: 重新分解
+                factor(t1, z0, hr)
+            z, ok = newton(t1, y, z0)
+            if not ok:                       # 重新分解後再試一次
+                factor(t1, z, hr)
+                z, ok = newton(t1, y, z)
+                if not ok:
+                    raise RuntimeError(f"auto_euler: Newton failed at t={t1}")
+            y = z
+            methods[k] = "I"
+        else:
+            y = y + h * fy
+            methods[k] = "E"
+        ys[k+1] = y
+
+    return ts, (ys[:, 0] if scalar else ys), methods, stats
+
+def main():
+    print("=== Stiffness-switching Euler ===")
+
+    print("\ny' = -5y, y(0) = 1 on [0,10]")
+    for h in [0.1, 0.41, 0.5]:
+        ts, ys, m, st = auto_euler(lambda t, y: -5.0 * y, h, 10.0, 1.0, jac=lambda t, y: -5.0)
+        err = np.max(np.abs(ys - np.exp(-5.0 * ts)))
+        print(f"h={h:5.2f}: explicit {np.sum(m == 'E'):4d}, implicit {np.sum(m == 'I'):4d}, "
+              f"LU {st['nlu']}, Newton its {st['nnewton']:4d}, max|err| = {err:.3e}")
+
+    # stiffness grows with t: y' = -k(t)(y - sin t) + cos t, k = 1 + 100 t^2, y = sin t
+    print("\ny' = -(1+100t^2)(y - sin t) + cos t, y(0) = 0 on [0,5], h = 0.02")
+    f = lambda t, y: -(1.0 + 100.0 * t * t) * (y - np.sin(t)) + np.cos(t)
+    ts, ys, m, st = auto_euler(f, 0.02, 5.0, 0.0)
+    switch = ts[np.argmax(m == "I")]
+    print(f"explicit {np.sum(m == 'E')}, implicit {np.sum(m == 'I')}, first implicit step at t={switch:.2f}, "
+          f"max|err| = {np.max(np.abs(ys - np.sin(ts))):.3e}, stats = {st}")
+
+    # 2x2 system, eigenvalues -1 and -1000: matrix-free power iteration
+    print("\ny' = A y, eig(A) = {-1, -1000}, h = 0.01 (FE would need h < 0.002)")
+    A = np.array([[-500.5, 499.5], [499.5, -500.5]])
+    ts, ys, m, st = auto_euler(lambda t, y: A @ y, 0.01, 2.0, np.array([2.0, 0.0]))
+    exact = np.stack([np.exp(-ts) + np.exp(-1000 * ts), np.exp(-ts) - np.exp(-1000 * ts)], axis=1)
+    print(f"explicit {np.sum(m == 'E')}, implicit {np.sum(m == 'I')}, LU {st['nlu']}, "
+          f"max|err| = {np.max(np.abs(ys - exact)):.3e}, f-evals {st['nfev']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# dopri.py
+# Dormand–Prince 5(4) with PI step-size control and dense output,
+# same f(t, y) interface as the Euler scripts (y may be a scalar or a vector).
+# Coefficients and controller follow Hairer & Wanner, DOPRI5.
+
+import numpy as np
+
+# ---- Butcher tableau ----
+C = np.array([0.0, 1/5, 3/10, 4/5, 8/9, 1.0, 1.0])
+A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+B = np.array(A[6] + [0.0])                      # 5th order weights (FSAL)
+E = np.array([71/57600, 0.0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])  # y5 - y4
+D = np.array([-12715105075/11282082432, 0.0, 87487479700/32700410799,
+              -10690763975/1880347072, 701980252875/199316789632,
+              -1453857185/822651844, 69997945/29380423])    # dense output
+
+class DopriSolution:
+    """Accepted steps + dense output; sol(t) evaluates anywhere in [t0, t_end]."""
+    def __init__(self, ts, ys, rcont, nsteps, nreject, nfev, scalar):
+        self.t = ts                  # step endpoints, (n+1,)
+        self.y = ys                  # solution at ts, (n+1, dim)
+        self.rcont = rcont           # (n, 5, dim) continuous extension per step
+        self.nsteps, self.nreject, self.nfev = nsteps, nreject, nfev
+        self._scalar = scalar
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        i = np.clip(np.searchsorted(self.t, t, side="right") - 1, 0, len(self.t) - 2)
+        h = self.t[i+1] - self.t[i]
+        th = ((t - self.t[i]) / h)[..., None]
+        r = self.rcont[i]
+        th1 = 1.0 - th
+        y = r[..., 0, :] + th * (r[..., 1, :] + th1 * (r[..., 2, :]
+                + th * (r[..., 3, :] + th1 * r[..., 4, :])))
+        return y[..., 0] if self._scalar else y
+
+def _norm(v, sc):
+    return np.sqrt(np.mean((v / sc) ** 2))
+
+def dopri5(f, t_span, y0, rtol=1e-6, atol=1e-9, h0=None, max_steps=100000,
+           safe=0.9, beta=0.04, fac_min=0.2, fac_max=10.0):
+    """Integrate y' = f(t, y) over t_span = (t0, t_end); returns a DopriSolution."""
+    t0, t_end = map(float, t_span)
+    scalar = np.ndim(y0) == 0
+    fun = (lambda t, y: np.atleast_1d(f(t, y[0]))) if scalar else \
+          (lambda t, y: np.asarray(f(t, y), dtype=float))
+    y = np.atleast_1d(np.asarray(y0, dtype=float)).copy()
+    k1 = fun(t0, y)
+    nfev = 1
+
+    if h0 is None:    # Hairer's starting step guess
+        sc = atol + rtol * np.abs(y)
+        d0, d1 = _norm(y, sc), _norm(k1, sc)
+        h = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        h = min(h, t_end - t0)
+        k2 = fun(t0 + h, y + h * k1)
+        nfev += 1
+        d2 = _norm(k2 - k1, sc) / h
+        h1 = max(1e-6, h * 1e-3) if max(d1, d2) <= 1e-15 else (0.01 / max(d1, d2)) ** 0.2
+        h = min(100 * h, h1)
+    else:
+        h = h0
+
+    expo = 0.2 - 0.75 * beta
+    facold = 1e-4
+    ts, ys, rc = [t0], [y.copy()], []
+    t, nsteps, nreject, last_rejected = t0, 0, 0, False
+    K = np.empty((7, len(y)))
+    while t < t_end:
+        if nsteps + nreject >= max_steps:
+            raise RuntimeError(f"dopri5: max_steps={max_steps} reached at t={t}")
+        if t + 1.01 * h >= t_end:
+            h = t_end - t
+        K[0] = k1
+        for s in range(1, 7):
+            K[s] = fun(t + C[s] * h, y + h * (np.asarray(A[s]) @ K[:s]))
+        nfev += 6
+        y_new = y + h * (B[:6] @ K[:6])              # = stage 7 argument (FSAL)
+        sc = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+        err = _norm(h * (E @ K), sc)
+
+        # PI controller
+        fac11 = err ** expo
+        fac = fac11 / facold ** beta
+        fac = max(1.0 / fac_max, min(1.0 / fac_min, fac / safe))
+        h_new = h / fac
+        if err <= 1.0:
+            facold = max(err, 1e-4)
+            ydiff = y_new - y
+            bspl = h * K[0] - ydiff
+            rc.append(np.stack([y, ydiff, bspl, ydiff - h * K[6] - bspl, h * (D @ K)]))
+            t, y, k1 = t + h, y_new, K[6].copy()
+            ts.append(t)
+            ys.append(y.copy())
+            nsteps += 1
+            if last_rejected:
+                h_new = min(h_new, h)
+            last_rejected = False
+        else:
+            h_new = h / min(1.0 / fac_min, fac11 / safe)
+            nreject += 1
+            last_rejected = True
+        h = h_new
+
+    return DopriSolution(np.array(ts), np.array(ys), np.array(rc),
+                         nsteps, nreject, nfev, scalar)
+
+def main():
+    print("=== Dormand–Prince 5(4), PI control, dense output ===")
+    t_check = np.linspace(0.0, 10.0, 10001)
+
+    print("\ny' = -5y, y(0) = 1 on [0,10]")
+    print(f"{'rtol':>8} | {'steps':>5} | {'rejected':>8} | {'f-evals':>7} | max error (dense)")
+    for rtol in [1e-4, 1e-6, 1e-8, 1e-10]:
+        sol = dopri5(lambda t, y: -5.0 * y, (0.0, 10.0), 1.0, rtol=rtol, atol=rtol * 1e-3)
+        err = np.max(np.abs(sol(t_check) - np.exp(-5.0 * t_check)))
+        print(f"{rtol:8.0e} | {sol.nsteps:5d} | {sol.nreject:8d} | {sol.nfev:7d} | {err:.3e}")
+
+    print("\ny' = y(1-y), y(0) = 0.2 on [0,10]")
+    exact = lambda t: 1.0 / (1.0 + 4.0 * np.exp(-t))
+    print(f"{'rtol':>8} | {'steps':>5} | {'rejected':>8} | {'f-evals':>7} | max error (dense)")
+    for rtol in [1e-4, 1e-6, 1e-8, 1e-10]:
+        sol = dopri5(lambda t, y: y * (1.0 - y), (0.0, 10.0), 0.2, rtol=rtol, atol=rtol * 1e-3)
+        err = np.max(np.abs(sol(t_check) - exact(t_check)))
+        print(f"{rtol:8.0e} | {sol.nsteps:5d} | {sol.nreject:8d} | {sol.nfev:7d} | {err:.3e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# ensemble.py
+# Forward Euler on y' = y(1-y) for a whole (h, u0) grid at once.
+# All trajectories advance with one vectorized update per step; the ones that
+# have blown up, or have settled at y=1 (|u-1| tiny and |1-h| < 1, so they can
+# no longer leave), are dropped from the active set and cost nothing further.
+
+import numpy as np
+
+def fe_logistic_ensemble(hs, u0s, steps=400, tol=1e-12, atol=1e-3, tail=50,
+                         blowup=1e6):
+    """
+    hs, u0s : 1-D arrays -> grid of shape (len(hs), len(u0s))
+    returns (inv, conv, exit_step, u_final)
+      inv       : trajectory stayed in [-tol, 1+tol] for all steps
+      conv      : last `tail` iterates within atol of 1 (as converges_to_one)
+      exit_step : first step n with u_n outside [-tol, 1+tol] (-1 if never)
+      u_final   : u_steps; for diverged ones the value at the blow-up step,
+                  for settled ones the value at the settle step (within min(tol, atol)/2 of 1)
+    """
+    H, U0 = np.meshgrid(np.asarray(hs, float), np.asarray(u0s, float), indexing="ij")
+    shape = H.shape
+    exit_step = np.full(H.size, -1, dtype=np.int64)
+    last_far = np.full(H.size, -1, dtype=np.int64)   # last n with |u_n - 1| >= atol
+    u_final = U0.ravel().copy()
+
+    idx = np.arange(H.size)                           # active trajectories
+    h = H.ravel().copy()
+    u = U0.ravel().copy()
+    out = (u < -tol) | (u > 1.0 + tol)
+    exit_step[idx[out]] = 0
+    last_far[idx[np.abs(u - 1.0) >= atol]] = 0
+    # settle threshold: well inside both the band and atol
+    eps = 0.5 * min(tol, atol)
+
+    for n in range(1, steps + 1):
+        u = u + h * u * (1.0 - u)
+        out = (u < -tol) | (u > 1.0 + tol)
+        first = out & (exit_step[idx] < 0)
+        exit_step[idx[first]] = n
+        far = np.abs(u - 1.0) >= atol
+        last_far[idx[far]] = n
+
+        done_blow = ~(np.abs(u) <= blowup)                  # also catches inf/nan
+        done_set = (np.abs(u - 1.0) < eps) & (np.abs(1.0 - h) < 1.0)
+        done = done_blow | done_set
+        if done.any():
+            u_final[idx[done]] = u[done]
+            last_far[idx[done_blow]] = steps                  # never converges
+            keep = ~done
+            idx, h, u = idx[keep], h[keep], u[keep]
+            if idx.size == 0:
+                break
+    u_final[idx] = u
+
+    inv = exit_step < 0
+    conv = last_far <= steps - tail
+    return (inv.reshape(shape), conv.reshape(shape),
+            exit_step.reshape(shape), u_final.reshape(shape))
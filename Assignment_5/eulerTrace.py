@@ -0,0 +1,48 @@
+# eulerTrace.py
+# Preallocated trace engine for one-step methods on [0, t_end].
+# - step count fixed up front: n = ceil(t_end/h) (with a relative guard), and
+#   t_k = k*h, so accumulated rounding in t += h can neither add nor drop a step
+# - linear problems y' = lam*y: y_{k+1} = g*y_k with a constant multiplier g,
+#   computed as a cumulative product (same rounding as the sequential loop)
+# - general f(t, y): a tight loop writing into preallocated arrays
+
+import numpy as np
+
+def n_steps(h: float, t_end: float) -> int:
+    """Smallest n with n*h >= t_end, ignoring rounding-level overshoot."""
+    return max(0, int(np.ceil(t_end / h * (1.0 - 1e-12))))
+
+def time_grid(h: float, t_end: float) -> np.ndarray:
+    return h * np.arange(n_steps(h, t_end) + 1)
+
+def linear_multiplier(lam: float, h: float, method: str = "fe") -> float:
+    """Amplification factor of y' = lam*y: FE 1 + h*lam, BE 1/(1 - h*lam)."""
+    if method == "fe":
+        return 1.0 + h * lam
+    if method == "be":
+        return 1.0 / (1.0 - h * lam)
+    raise ValueError("method must be 'fe' or 'be'")
+
+def linear_trace(lam: float, h: float, t_end: float, y0: float = 1.0, method: str = "fe",
+                 out=None):
+    """(ts, ys) for y' = lam*y, y(0) = y0, with y_k = y0 * g^k via cumprod.
+    out=(ts, ys) fills preallocated arrays (e.g. traceSink.open_trace memmaps)."""
+    n = n_steps(h, t_end) + 1
+    if out is None:
+        out = (np.empty(n), np.empty(n))
+    ts, ys = out
+    np.multiply(np.arange(n), h, out=ts)
+    ys.fill(linear_multiplier(lam, h, method))
+    ys[0] = y0
+    np.multiply.accumulate(ys, out=ys)
+    return ts, ys
+
+def fe_trace(f, h: float, t_end: float, y0: float = 1.0):
+    """(ts, ys) for Forward Euler y_{k+1} = y_k + h f(t_k, y_k), scalar y."""
+    ts = time_grid(h, t_end)
+    ys = np.empty(len(ts))
+    ys[0] = y = y0
+    for k in range(len(ts) - 1):
+        y = y + h * f(ts[k], y)
+        ys[k+1] = y
+    return ts, ys
@@ -8,36 +8,33 @@
 import math
 import numpy as np
 import matplotlib.pyplot as plt
-import csv
 from pathlib import Path
 
+from eulerTrace import linear_trace
+from traceSink import save_trace, log_trace, export_csv
+
 T_END = 10.0
+LOG_EVERY = 1      # 每 k 步印一行 (0: 只印 summary)
+WRITE_CSV = True   # 同時輸出 result/*.csv 格式的 CSV
 
-def y_true(t: float) -> float:
-    return math.exp(-5.0 * t)
+# vectorized: works on scalars and on whole time arrays
+def y_true(t):
+    return np.exp(-5.0 * t)
 
 def forward_euler_trace(h: float, t_end: float = T_END):
     """Return arrays of times, FE values, and abs errors."""
-    t = 0.0
-    y = 1.0
-    ts  = [t]
-    ys  = [y]
-    err = [abs(y - y_true(t))]
-    while t < t_end - 1e-15:
-        y = y + h * (-5.0 * y)   # Forward Euler update
-        t = t + h
-        ts.append(t)
-        ys.append(y)
-        err.append(abs(y - y_true(t)))
-    return np.array(ts), np.array(ys), np.array(err)
+    # Forward Euler on y' = -5y: y_{k+1} = (1 - 5h) y_k, t_k = k*h
+    ts, ys = linear_trace(-5.0, h, t_end, 1.0, "fe")
+    return ts, ys, np.abs(ys - y_true(ts))
 
 def save_csv(filename: str, ts, ys, errs):
-    Path(filename).parent.mkdir(parents=True, exist_ok=True)
-    with open(filename, "w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(["step", "t", "y_FE", "y_true", "abs_error"])
-        for k, (t, y, e) in enumerate(zip(ts, ys, errs)):
-            w.writerow([k, t, y, y_true(t), e])
+    export_csv(filename, ["t", "y_FE", "y_true", "abs_error"], [ts, ys, y_true(ts), errs])
+
+# 整條 trace 以欄為單位存成 .npz，CSV 為選擇性輸出
+def save_outputs(stem: str, ts, ys, errs):
+    save_trace(stem + ".npz", t=ts, y=ys, abs_error=errs)
+    if WRITE_CSV:
+        save_csv(stem + ".csv", ts, ys, errs)
 
 def max_error_over_grid(h: float, t_end: float = T_END) -> float:
     ts, ys, errs = forward_euler_trace(h, t_end)
@@ -51,15 +48,13 @@ def main():
 
         # 每次 iteration 輸出
         print(f"\n=== Forward Euler with h = {h} ===")
-        print(f"{'step':>4} | {'t':>8} | {'y_FE':>14} | {'y_true':>14} | {'|error|':>14}")
-        print("-" * 64)
-        for k, (t, y, e) in enumerate(zip(ts, ys, errs)):
-            print(f"{k:4d} | {t:8.4f} | {y:14.8f} | {y_true(t):14.8e} | {e:14.8f}")
+        log_trace(["step", "t", "y_FE", "y_true", "|error|"], [ts, ys, y_true(ts), errs],
+                  every=LOG_EVERY, fmts=["14.8f", "14.8e", "14.8f"])
 
         # 總結與 CSV
         print(f"steps = {len(ts)-1}, max|error| = {np.max(errs):.6e}, "
               f"final |e| at t={ts[-1]:.2f} = {errs[-1]:.6e}")
-        save_csv(f"out/fe_vs_true_h{str(h).replace('.','_')}.csv", ts, ys, errs)
+        save_outputs(f"out/fe_vs_true_h{str(h).replace('.','_')}", ts, ys, errs)
 
     # ---------- Part 2: 三個步長的 iteration error (log-log) 圖 ----------
     plt.figure()
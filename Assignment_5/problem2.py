@@ -8,6 +8,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from ensemble import fe_logistic_ensemble
+
 def fe_logistic(h, u0=0.2, steps=200):
     """Forward Euler trajectory for y' = y(1-y). Returns u[0..steps]."""
     u = np.empty(steps+1, dtype=float)
@@ -44,20 +46,39 @@ def main():
 
     hs = [round(0.1*k, 1) for k in range(1, 21)]  # 0.1 ... 2.0
 
+    # 整個 (h, u0) 網格一次推進: 第 0 欄是 u0=0.2，其餘是 (0,1) 內 4001 個起始值
+    u0s = np.concatenate(([u0], np.linspace(1e-9, 1.0-1e-9, 4001)))
+    inv, conv, _, u_fin = fe_logistic_ensemble(hs, u0s, steps=steps, tol=1e-12, atol=1e-3, tail=50)
+
     print(f"{'h':>4} | {'inv(single)':>12} | {'inv(all u0)':>11} | {'converges?':>11} | final u")
     print("-"*64)
-    for h in hs:
-        traj = fe_logistic(h, u0=u0, steps=steps)
-        inv_single = invariance_single(traj, tol=1e-12)
-        inv_all    = invariance_all_u0(h, steps=1, grid=4001, tol=1e-12)  # 一步就能抓到 h>1 的 overshoot
-        conv       = converges_to_one(traj, atol=1e-3, tail=50)
-        print(f"{h:>4} | {str(inv_single):>12} | {str(inv_all):>11} | {str(conv):>11} | {traj[-1]:.6f}")
+    for i, h in enumerate(hs):
+        inv_single = bool(inv[i, 0])
+        inv_all    = bool(inv[i, 1:].all())
+        print(f"{h:>4} | {str(inv_single):>12} | {str(inv_all):>11} | {str(bool(conv[i, 0])):>11} | {u_fin[i, 0]:.6f}")
 
     print("\nTheory summary:")
     print("  - Full invariance for ALL u0 in (0,1):  0 < h <= 1")
     print("  - Local stability near y=1:            0 < h < 2")
     print("  - Expect h=2.1 to overshoot/exit. For 1 < h < 2, some u0 may overshoot.\n")
 
+    # 高解析度穩定圖: 500 x 1001 條軌跡 (h, u0)
+    h_map = np.linspace(0.01, 2.5, 500)
+    u0_map = np.linspace(1e-9, 1.0-1e-9, 1001)
+    inv_m, conv_m, exit_m, _ = fe_logistic_ensemble(h_map, u0_map, steps=steps)
+    fig, axes = plt.subplots(1, 3, figsize=(15, 4.5))
+    ext = [u0_map[0], u0_map[-1], h_map[0], h_map[-1]]
+    for ax, data, title in zip(axes, [inv_m, conv_m, np.where(exit_m < 0, np.nan, exit_m)],
+                               ["invariance of (0,1)", "converges to 1", "escape step"]):
+        im = ax.imshow(data.astype(float), origin="lower", aspect="auto", extent=ext)
+        ax.set_xlabel("u0")
+        ax.set_ylabel("h")
+        ax.set_title(title)
+        fig.colorbar(im, ax=ax)
+    fig.tight_layout()
+    fig.savefig("logistic_FE_stability_map.png", dpi=150)
+    print("Saved figure: logistic_FE_stability_map.png")
+
     # Plot illustrative trajectories
     demo_hs = [0.1, 1.0, 1.9]
     plt.figure()
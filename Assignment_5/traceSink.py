@@ -0,0 +1,64 @@
+# traceSink.py
+# Column-wise output for step traces (step, t, y, y_true, abs_error, ...).
+# - binary: whole columns to .npz in one call, or .npy memmaps for traces
+#   that should not live in RAM (open_trace)
+# - text: decimated logging (every k-th step + the last one, or summary only)
+# - CSV: whole-array export; floats are written with repr(), giving the same
+#   columns and number format as result/*.csv (not a byte-identical copy)
+
+import numpy as np
+from pathlib import Path
+
+def save_trace(path, **cols):
+    """Write named columns to one .npz (uncompressed, one bulk write per column)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(path, **{k: np.asarray(v) for k, v in cols.items()})
+
+def load_trace(path, mmap: bool = False):
+    """Columns as a dict; from a .npz file, or a directory of .npy memmaps."""
+    path = Path(path)
+    if path.is_dir():
+        return {p.stem: np.load(p, mmap_mode="r" if mmap else None)
+                for p in sorted(path.glob("*.npy"))}
+    with np.load(path) as z:
+        return {k: z[k] for k in z.files}
+
+def open_trace(dirpath, n: int, names, dtype=np.float64):
+    """Preallocate one .npy memmap per column (dirpath/<name>.npy), length n.
+    Fill them in place (e.g. linear_trace(..., out=...)) and call flush()."""
+    dirpath = Path(dirpath)
+    dirpath.mkdir(parents=True, exist_ok=True)
+    return {name: np.lib.format.open_memmap(dirpath / f"{name}.npy", mode="w+",
+                                            dtype=dtype, shape=(n,))
+            for name in names}
+
+def log_trace(names, cols, every: int = 1, fmts=None):
+    """Print rows 0, every, 2*every, ... and the last row; every=0 prints nothing
+    (summary only). names = ("step", "t", ...), cols = (ts, col1, col2, ...);
+    fmts gives the format spec of each column after t (default 14.8e)."""
+    n = len(cols[0])
+    if every <= 0 or n == 0:
+        return
+    fmts = fmts or ["14.8e"] * (len(cols) - 1)
+    idx = np.arange(0, n, every)
+    if idx[-1] != n - 1:
+        idx = np.append(idx, n - 1)
+    vals = [np.asarray(c)[idx].tolist() for c in cols]
+    head = f"{names[0]:>4} | {names[1]:>8} | " + " | ".join(f"{s:>14}" for s in names[2:])
+    rows = [f"{k:4d} | {row[0]:8.4f} | " + " | ".join(f"{v:{fm}}" for v, fm in zip(row[1:], fmts))
+            for k, row in zip(idx.tolist(), zip(*vals))]
+    print("\n".join([head, "-" * 64] + rows))
+
+def export_csv(path, names, cols, index: str | None = "step"):
+    """Write columns as CSV in one pass; optional leading integer index column."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lists = [np.asarray(c).tolist() for c in cols]       # python floats -> repr()
+    header = ([index] if index else []) + list(names)
+    if index:
+        lists.insert(0, range(len(lists[0])))
+    line = ",".join(["{!r}"] * len(lists)).format
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(",".join(header) + "\n")
+        f.write("".join(line(*row) + "\n" for row in zip(*lists)))
@@ -1,13 +1,20 @@
+import time
 import numpy as np
 import matplotlib.pyplot as plt
-import scipy.integrate as integrate
 from scipy.sparse import diags
 from scipy.sparse.linalg import spsolve
-
-def solve_bvp_linear(N):
+import sys
+from pathlib import Path
+# 共用的參考值快取與 DST 快速 Poisson 解 (common/refCache.py, common/fastPoisson.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from refCache import cached_reference
+from fastPoisson import poisson_solve
+
+def solve_bvp_linear(N, solver="spsolve"):
     """
     使用 FDM 求解線性 BVP: -u'' = exp(sin(x))
     N: 網格 *區間* 的數量
+    solver: "spsolve" (稀疏直接解) 或 "dst" (DST-I 快速 Poisson 解)
     """
     
     # 1. 設置網格
@@ -19,6 +26,9 @@ def solve_bvp_linear(N):
     # 完整節點 (i=0 to N)
     x_full = np.linspace(0, 1.0, N + 1)
     
+    if solver == "dst":
+        return x_full, poisson_solve(np.exp(np.sin(x_full)), h, "dirichlet")
+    
     # 2. 構建矩陣 A
     # 主對角線
     main_diag = np.full(N - 1, 2.0)
@@ -45,29 +55,37 @@ def solve_bvp_linear(N):
 
 def compute_exact_solution(x_nodes):
     """
-    計算給定 x 節點處的精確解
+    計算給定 x 節點處的精確解 (結果快取於磁碟，key 包含網格本身)
     u(x) = (1-x) * int_0^x (s * exp(sin(s))) ds + x * int_x^1 ((1-s) * exp(sin(s))) ds
     """
+    x_nodes = np.asarray(x_nodes, dtype=float)
+    return cached_reference("A7.BVP.exact", lambda: exact_solution_gl(x_nodes),
+                            pde="-u''=exp(sin x)", bc=[0, 0], grid=x_nodes, method="gauss-legendre")
+
+def exact_solution_gl(x_nodes, n_gauss=10, n_panels=64):
+    """
+    累積 Gauss–Legendre 求精確解：
+    斷點 = 節點 ∪ [0,1] 的 n_panels 等分，每個小區間上用 n_gauss 點 GL，
+    I1(x) = int_0^x s e^{sin s} ds 由左往右 cumsum，
+    I2(x) = int_x^1 (1-s) e^{sin s} ds 由右往左 cumsum，總工作量 O(N)
+    """
+    x_nodes = np.asarray(x_nodes, dtype=float)
+    xi, wi = np.polynomial.legendre.leggauss(n_gauss)
     
-    # 定義積分項
-    def integrand1(s):
-        return s * np.exp(np.sin(s))
-    
-    def integrand2(s):
-        return (1 - s) * np.exp(np.sin(s))
+    # 斷點與每段上的 GL 節點 (panels x n_gauss)
+    brk = np.union1d(np.clip(x_nodes, 0.0, 1.0), np.linspace(0.0, 1.0, n_panels + 1))
+    half = 0.5 * np.diff(brk)
+    s = (0.5 * (brk[:-1] + brk[1:]))[:, None] + half[:, None] * xi
+    e = np.exp(np.sin(s))
+    seg1 = half * ((s * e) @ wi)
+    seg2 = half * (((1 - s) * e) @ wi)
     
-    u_exact_values = []
+    # 兩次累積：I1 在 brk[k] 的值、I2 在 brk[k] 的值
+    I1 = np.concatenate(([0.0], np.cumsum(seg1)))
+    I2 = np.concatenate((np.cumsum(seg2[::-1])[::-1], [0.0]))
     
-    # 遍歷所有 x 節點
-    for x in x_nodes:
-        # 使用 scipy.integrate.quad 進行高精度積分
-        integral1, _ = integrate.quad(integrand1, 0, x)
-        integral2, _ = integrate.quad(integrand2, x, 1)
-        
-        u_val = (1 - x) * integral1 + x * integral2
-        u_exact_values.append(u_val)
-        
-    return np.array(u_exact_values)
+    k = np.searchsorted(brk, x_nodes)
+    return (1 - x_nodes) * I1[k] + x_nodes * I2[k]
 
 # --- 1. 繪製數值解與精確解對比圖 ---
 
@@ -141,3 +159,14 @@ slope, _ = np.polyfit(log_h, log_E, 1)
 
 print("\n--- Log-Log Slope Analysis ---")
 print(f"The experimentally determined order of convergence (EOC) is: {slope:.6f}")
+
+# --- 3. 大 N: 稀疏直接解 vs DST 快速 Poisson 解 ---
+N_big = 10**6
+t0 = time.perf_counter()
+_, u_sp = solve_bvp_linear(N_big)
+t_sp = time.perf_counter() - t0
+t0 = time.perf_counter()
+_, u_dst = solve_bvp_linear(N_big, solver="dst")
+t_dst = time.perf_counter() - t0
+print(f"\nN={N_big}: spsolve {t_sp:.3f} s, DST {t_dst:.3f} s, "
+      f"max|u_dst - u_sp| = {np.max(np.abs(u_dst - u_sp)):.2e}")
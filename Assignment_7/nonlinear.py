@@ -1,13 +1,64 @@
+import time
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.optimize import root
-from scipy.sparse import diags
-
-def solve_bvp_fdm(N):
+from scipy.linalg import solve_banded
+
+EPS = np.finfo(float).eps
+
+def residual(U, h2, u_a, u_b):
+    """F_i = U_{i-1} - 2U_i + U_{i+1} - h^2 sin(U_i), with U_0 = u_a, U_N = u_b (slices, no loop)."""
+    F = np.empty_like(U)
+    F[1:-1] = U[:-2] - 2.0 * U[1:-1] + U[2:]
+    F[0] = u_a - 2.0 * U[0] + U[1]
+    F[-1] = U[-2] - 2.0 * U[-1] + u_b
+    F -= h2 * np.sin(U)
+    return F
+
+def jacobian_banded(U, h2):
+    """Tridiagonal Jacobian of residual() in solve_banded's (1, 1) layout, shape (3, n)."""
+    ab = np.ones((3, len(U)))
+    ab[0, 0] = ab[2, -1] = 0.0
+    ab[1] = -2.0 - h2 * np.cos(U)
+    return ab
+
+def newton_banded(U0, h2, u_a, u_b, tol=1e-10, max_iter=50, verbose=False):
+    """Damped Newton with a tridiagonal solve per step.
+
+    Stops when ||dU||_inf <= tol (1 + ||U||_inf). Backtracking halves the step
+    until ||F|| decreases, unless ||F|| is already at the rounding floor of the
+    h^2-scaled residual. Returns (U, converged, history of ||F||_inf / h^2).
+    """
+    U = np.array(U0, dtype=float)
+    F = residual(U, h2, u_a, u_b)
+    nF = np.max(np.abs(F))
+    hist = [nF / h2]
+    for it in range(1, max_iter + 1):
+        dU = solve_banded((1, 1), jacobian_banded(U, h2), -F,
+                          overwrite_ab=True, check_finite=False)
+        floor = 8.0 * EPS * max(1.0, np.max(np.abs(U)))
+        lam = 1.0
+        while True:
+            U_new = U + lam * dU
+            F_new = residual(U_new, h2, u_a, u_b)
+            nF_new = np.max(np.abs(F_new))
+            if nF_new <= (1.0 - 0.25 * lam) * nF or nF <= floor or lam < 1e-3:
+                break
+            lam *= 0.5
+        U, F, nF = U_new, F_new, nF_new
+        hist.append(nF / h2)
+        step = lam * np.max(np.abs(dU))
+        if verbose:
+            print(f"  Newton {it:2d}: lambda = {lam:.3g}, ||dU|| = {step:.3e}, ||F||/h^2 = {nF / h2:.3e}")
+        if step <= tol * (1.0 + np.max(np.abs(U))):
+            return U, True, hist
+    return U, False, hist
+
+def solve_bvp_fdm(N, U_guess=None, verbose=False):
     """
     Solves the nonlinear BVP u'' = sin(u) using FDM.
     BCs: u(0) = 1, u(1) = 1
     N: Number of grid *intervals*
+    Returns x, u (None on failure) and the Newton residual history.
     """
     
     # 1. Setup grid
@@ -20,42 +71,39 @@ def solve_bvp_fdm(N):
     u_b = 1.0  # u(1)
     h2 = h * h
 
-    # 2. Define the nonlinear system F(U) = 0
-    def F(U):
-        F_vec = np.zeros(num_unknowns)
-        # i = 1
-        F_vec[0] = u_a - 2 * U[0] + U[1] - h2 * np.sin(U[0])
-        # i = 2 to N-2
-        for i in range(1, num_unknowns - 1):
-            F_vec[i] = U[i-1] - 2 * U[i] + U[i+1] - h2 * np.sin(U[i])
-        # i = N-1
-        F_vec[-1] = U[-2] - 2 * U[-1] + u_b - h2 * np.sin(U[-1])
-        return F_vec
-
-    # 3. Define the Jacobian matrix J(U)
-    def J(U):
-        diag_main = -2.0 - h2 * np.cos(U)
-        diag_upper = np.ones(num_unknowns - 1)
-        diag_lower = np.ones(num_unknowns - 1)
-        J_matrix = diags([diag_lower, diag_main, diag_upper], 
-                         [-1, 0, 1], 
-                         shape=(num_unknowns, num_unknowns)).toarray()
-        return J_matrix
-
-    # 4. Initial guess
-    U_guess = np.ones(num_unknowns)
-    
-    # 5. Solve the system
-    sol = root(F, U_guess, jac=J, method='lm')
-    
-    if not sol.success:
-        print(f"Solver failed for N={N}: {sol.message}")
-        return None, None
+    # 2. Initial guess
+    if U_guess is None:
+        U_guess = np.ones(num_unknowns)
+
+    # 3. Damped Newton, tridiagonal Jacobian (residual / Jacobian: see above)
+    U, converged, hist = newton_banded(U_guess, h2, u_a, u_b, verbose=verbose)
 
-    # 6. Assemble the full solution
-    u_solution = np.concatenate(([u_a], sol.x, [u_b]))
+    if not converged:
+        print(f"Solver failed for N={N}: no convergence in {len(hist)-1} Newton steps")
+        return None, None, hist
+
+    # 4. Assemble the full solution
+    u_solution = np.concatenate(([u_a], U, [u_b]))
     
-    return x, u_solution
+    return x, u_solution, hist
+
+def solve_nested(N_list, verbose=False):
+    """
+    Grid sequencing: solve on each N in N_list (coarse -> fine), starting every
+    level from the previous converged solution linearly interpolated onto its grid.
+    Returns {N: {'x', 'u', 'newton'}}; the first level starts from U = 1.
+    """
+    sols = {}
+    x_prev = u_prev = None
+    for N in N_list:
+        U_guess = None
+        if u_prev is not None:
+            U_guess = np.interp(np.linspace(0, 1, N + 1)[1:-1], x_prev, u_prev)
+        x, u, hist = solve_bvp_fdm(N, U_guess, verbose=verbose)
+        sols[N] = {'x': x, 'u': u, 'newton': len(hist) - 1, 'hist': hist}
+        if u is not None:
+            x_prev, u_prev = x, u
+    return sols
 
 # --- Main Program ---
 
@@ -66,13 +114,13 @@ N_values = [10, 20, 40, 80, 160]
 # Store all computed solutions for plotting and error analysis
 all_solutions = {} 
 
-# 2. Compute all solutions
+# 2. Compute all solutions (grid sequencing: each N warm-starts from the previous one)
 print("\n--- Computing Solutions for Various Grid Sizes ---")
-for N in N_values:
-    x, u = solve_bvp_fdm(N)
-    if u is not None:
-        all_solutions[N] = {'x': x, 'u': u}
-        print(f"Solution for N={N} computed.")
+for N, sol in solve_nested(N_values).items():
+    if sol['u'] is not None:
+        all_solutions[N] = {'x': sol['x'], 'u': sol['u']}
+        print(f"Solution for N={N} computed: {sol['newton']} Newton steps, "
+              f"||F||/h^2 = " + ", ".join(f"{r:.2e}" for r in sol['hist']))
     else:
         print(f"Failed to compute solution for N={N}.")
 
@@ -149,3 +197,24 @@ slope, intercept = np.polyfit(log_h, log_E, 1)
 
 print("\n--- Log-Log Slope Analysis ---")
 print(f"The experimentally determined order of convergence (EOC) is: {slope:.6f}")
+
+# --- Large N: banded Newton timing ---
+N_big = 10**6
+print(f"\n--- Banded Newton at N={N_big} (cold start, U = 1) ---")
+t0 = time.perf_counter()
+x_big, u_big, hist_big = solve_bvp_fdm(N_big, verbose=True)
+elapsed = time.perf_counter() - t0
+print(f"{len(hist_big)-1} Newton steps in {elapsed:.3f} s "
+      f"({elapsed / (len(hist_big)-1):.3f} s per step), u(1/2) = {u_big[N_big // 2]:.12f}")
+
+# --- Same N via grid sequencing 10 -> 10^6 ---
+ladder = [10**k for k in range(1, 7)]
+print(f"\n--- Grid sequencing {ladder[0]} -> {ladder[-1]} ---")
+t0 = time.perf_counter()
+seq = solve_nested(ladder)
+elapsed_seq = time.perf_counter() - t0
+for N in ladder:
+    print(f"N={N:8d}: {seq[N]['newton']} Newton steps")
+u_seq = seq[N_big]['u']
+print(f"total {elapsed_seq:.3f} s (cold single solve {elapsed:.3f} s), "
+      f"max|u_seq - u_cold| = {np.max(np.abs(u_seq - u_big)):.2e}")
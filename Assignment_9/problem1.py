@@ -1,43 +1,45 @@
+import time
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+import sys
+from pathlib import Path
+from tridiag import TriDiag
+# 共用的 DST 快速 Poisson 解 (common/fastPoisson.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from fastPoisson import poisson_solve
+
 def exact_solution(x):
     """計算解析解 (Exact Solution)"""
-    u = np.zeros_like(x)
-    for i, xi in enumerate(x):
-        if xi <= 0.4:
-            u[i] = -0.1 * xi
-        elif 0.4 < xi <= 0.6:
-            u[i] = 0.08 - 0.5 * xi + 0.5 * xi**2
-        else:
-            u[i] = -0.1 * (1 - xi)
-    return u
-
-def solve_fdm_standard(N):
-    """標準 FDM 求解 (不含邊界修正)"""
+    return np.select([x <= 0.4, x <= 0.6],
+                     [-0.1 * x, 0.08 - 0.5 * x + 0.5 * x**2],
+                     -0.1 * (1 - x))
+
+def solve_fdm_standard(N, solver="banded"):
+    """標準 FDM 求解 (不含邊界修正)
+    solver: "banded" (三對角 O(N)) 或 "dst" (DST-I 快速 Poisson 解)"""
     h = 1.0 / N
     x = np.linspace(0, 1, N+1)
     dim = N - 1
-    A = np.zeros((dim, dim))
-    b = np.zeros(dim)
     
-    # 建立矩陣
-    for i in range(dim):
-        A[i, i] = -2.0
-        if i > 0:     A[i, i-1] = 1.0
-        if i < dim-1: A[i, i+1] = 1.0
-        
-        # 建立 RHS (標準採樣: f(x)=1 if 0.4<=x<=0.6)
-        xi = x[i+1]
-        # 使用極小值避免浮點數誤差
-        if 0.4 - 1e-9 <= xi <= 0.6 + 1e-9:
-            f_val = 1.0
-        else:
-            f_val = 0.0
-        b[i] = (h**2) * f_val
+    # 建立 RHS (標準採樣: f(x)=1 if 0.4<=x<=0.6)
+    # 使用極小值避免浮點數誤差
+    xi = x[1:N]
+    f_val = np.where((0.4 - 1e-9 <= xi) & (xi <= 0.6 + 1e-9), 1.0, 0.0)
+    b = (h**2) * f_val
+    
+    if solver == "dst":
+        # u'' = f  <=>  -u'' = -f，u(0)=u(1)=0
+        f_full = np.zeros(N+1)
+        f_full[1:N] = -f_val
+        return x, poisson_solve(f_full, h, "dirichlet")
+    
+    # 建立矩陣 (三對角, banded 儲存), u(0)=u(1)=0
+    A = TriDiag(dim, 1.0, -2.0, 1.0)
+    A.dirichlet(b, left=0.0, right=0.0)
         
-    u_inner = np.linalg.solve(A, b)
+    u_inner = A.solve(b)
     u_sol = np.zeros(N+1)
     u_sol[1:N] = u_inner
     return x, u_sol
@@ -84,7 +86,22 @@ for N in N_values:
     print(f"{N:<5} | {h:<8.4f} | {max_err:.4e}   | {ratio_str}")
     prev_error = max_err
 
-
+# --- 大 N (banded O(N) 求解, 每次 N x10) ---
+print(f"\n{'N':<9} | {'h':<8} | {'Max Error':<12} | {'Ratio':<8} | {'time (s)':<8} | {'DST (s)':<8} | |u_dst - u|")
+print("-" * 85)
+prev_error = None
+for N in [10**4, 10**5, 10**6, 10**7]:
+    t0 = time.perf_counter()
+    x, u_num = solve_fdm_standard(N)
+    elapsed = time.perf_counter() - t0
+    max_err = np.max(np.abs(u_num - exact_solution(x)))
+    t0 = time.perf_counter()
+    _, u_dst = solve_fdm_standard(N, solver="dst")
+    elapsed_dst = time.perf_counter() - t0
+    ratio_str = "N/A" if prev_error is None else f"{prev_error / max_err:.4f}"
+    print(f"{N:<9} | {1.0/N:<8.1e} | {max_err:.4e}   | {ratio_str:<8} | {elapsed:<8.3f} | "
+          f"{elapsed_dst:<8.3f} | {np.max(np.abs(u_dst - u_num)):.1e}")
+    prev_error = max_err
 
 
 
@@ -2,6 +2,8 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from tridiag import TriDiag
+
 def exact_solution(t):
     """您推導出的真值解"""
     # u(t) = 1 - e^t + ( (1 + e^-1)/2 ) * t * e^t
@@ -14,48 +16,27 @@ def solve_bvp_fdm(N):
     
     # 我們求解 u[1] 到 u[N]，共 N 個未知數 (u[0]已知為0)
     dim = N
-    A = np.zeros((dim, dim))
-    b = np.zeros(dim)
     
     # 係數定義
     coeff_m1 = 1 + h      # u_{i-1} 的係數
     coeff_0  = h**2 - 2   # u_i     的係數
     coeff_p1 = 1 - h      # u_{i+1} 的係數
     
-    for i in range(dim):
-        # 矩陣索引 i 對應到真實網格點 index = i + 1
-        # 例如矩陣第 0 列代表計算 u_1 的方程式
-        
-        # 主對角線
-        A[i, i] = coeff_0
-        
-        # 下對角線 (涉及 u_{i-1})
-        if i > 0:
-            A[i, i-1] = coeff_m1
-            
-        # 上對角線 (涉及 u_{i+1})
-        if i < dim - 1:
-            A[i, i+1] = coeff_p1
-            
-        # RHS
-        b[i] = h**2
+    # 矩陣第 i 列對應到真實網格點 index = i + 1 (三對角, banded 儲存)
+    A = TriDiag(dim, coeff_m1, coeff_0, coeff_p1)
+    b = np.full(dim, h**2)   # RHS
 
-    # --- 修正邊界條件 ---
-    
-    # 1. 左邊界 (計算 u_1 時): 
-    # 方程式為: (1+h)u_0 + ... = h^2
-    # 因為 u_0 = 0，該項消失，不用修改 b[0]
+    # --- 邊界條件 ---
     
-    # 2. 右邊界 (計算 u_N 時，即矩陣最後一列 index = dim-1):
-    # 使用推導出的鬼點公式: 2*u_{N-1} + (h^2-2)u_N = h^2 - 2h(1-h)
+    # 1. 左邊界 (計算 u_1 時): u_0 = 0，移項後 b[0] 不變
+    A.dirichlet(b, left=0.0)
     
-    # 修改 u_{N-1} 的係數 (變為 2)
-    A[dim-1, dim-2] = 2.0
-    # 修改 RHS
-    b[dim-1] = h**2 - 2 * h * (1 - h)
+    # 2. 右邊界 (計算 u_N 時): u'(1) = 1，鬼點 u_{N+1} = u_{N-1} + 2h
+    # 得到: 2*u_{N-1} + (h^2-2)u_N = h^2 - 2h(1-h)
+    A.neumann(b, h, right=1.0)
     
     # 求解
-    u_inner = np.linalg.solve(A, b)
+    u_inner = A.solve(b)
     
     # 組合完整解 (補回 u_0)
     u_full = np.zeros(N+1)
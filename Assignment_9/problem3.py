@@ -1,7 +1,10 @@
+import time
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from tridiag import TriDiag
+
 def exact_solution(x):
     """您推導出的真值解 (設定 C2=0 -> u(0)=0)"""
     return (x / (2 * np.pi)) - (np.sin(2 * np.pi * x) / (4 * np.pi**2))
@@ -10,36 +13,21 @@ def solve_neumann_fdm(N):
     h = 1.0 / N
     x = np.linspace(0, 1, N+1)
     dim = N + 1
-    A = np.zeros((dim, dim))
-    b = np.zeros(dim)
     
     # 建立 Source term
     f = np.sin(2 * np.pi * x)
     
-    # 1. 內部節點
-    for i in range(1, N):
-        A[i, i-1] = 1.0
-        A[i, i]   = -2.0
-        A[i, i+1] = 1.0
-        b[i]      = (h**2) * f[i]
+    # 1. 所有節點 (含邊界): u_{i-1} - 2u_i + u_{i+1} = h^2 f_i
+    A = TriDiag(dim, 1.0, -2.0, 1.0)
+    b = (h**2) * f
         
-    # 2. 左邊界 (Ghost Point 推導結果: -2u0 + 2u1 = 0)
-    A[0, 0] = -2.0
-    A[0, 1] = 2.0
-    b[0]    = (h**2) * f[0] # f(0)=0
-    
-    # 3. 右邊界 (Ghost Point 推導結果: 2u_{N-1} - 2u_N = 0)
-    A[N, N-1] = 2.0
-    A[N, N]   = -2.0
-    b[N]      = (h**2) * f[N] # f(1)=0
-    
-    # 4. 求解奇異矩陣
-    # 使用 Least Squares 求解
-    u_raw, _, _, _ = np.linalg.lstsq(A, b, rcond=None)
+    # 2. 左右邊界 u'(0) = u'(1) = 0 (Ghost Point 推導結果):
+    #    -2u0 + 2u1 = h^2 f(0),  2u_{N-1} - 2u_N = h^2 f(1)
+    A.neumann(b, h, left=0.0, right=0.0)
     
-    # 5. 平移解 (Shift)
-    # 您的真值解是 u(0)=0，所以我們將數值解整條平移，讓 u_num[0] = 0
-    u_sol = u_raw - u_raw[0]
+    # 4. 求解奇異矩陣 (零空間 = 常數)
+    # 先檢查相容條件，再固定 u_num[0] = 0 (真值解 u(0)=0) 解縮減後的三對角系統
+    u_sol, _ = A.solve_neumann(b, u0=0.0)
     
     return x, u_sol
 
@@ -69,6 +57,15 @@ for N in N_values:
     print(f"{N:<5} | {1/N:<8.4f} | {max_err:.4e}   | {ratio_str:<6} | {order_str:<6}")
     prev_error = max_err
 
+# --- 大 N: 相容性檢查 + 縮減三對角求解，時間應隨 N 線性成長 ---
+print(f"\n{'N':<9} | {'Max Error':<12} | {'time (s)'}")
+print("-" * 40)
+for N in [10**4, 10**5, 10**6, 10**7]:
+    t0 = time.perf_counter()
+    x, u_fdm = solve_neumann_fdm(N)
+    elapsed = time.perf_counter() - t0
+    print(f"{N:<9} | {np.max(np.abs(u_fdm - exact_solution(x))):.4e}   | {elapsed:.3f}")
+
 # --- 繪圖 (使用 N=40) ---
 x_plot, u_plot = solve_neumann_fdm(40)
 u_true_plot = exact_solution(x_plot)
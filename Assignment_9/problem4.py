@@ -1,6 +1,12 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.integrate import quad, solve_ivp
+import sys
+from pathlib import Path
+# 共用的參考值快取 (common/refCache.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from refCache import cached_reference
+from tridiag import TriDiag
 
 # --- 1. 計算 alpha ---
 def source_f(x):
@@ -17,43 +23,35 @@ print(f"Calculated alpha = {alpha_val:.8f}")
 def ode_system(t, y):
     return [y[1], source_f(t)]
 
-sol = solve_ivp(ode_system, [0, 1], [0, 0], t_eval=np.linspace(0, 1, 321), rtol=1e-13)
-x_true = sol.t
-u_true = sol.y[0]
+# 參考解快取於磁碟 (key: 問題、初始條件、網格、rtol)
+def ivp_reference(t_eval, rtol=1e-13):
+    def compute():
+        sol = solve_ivp(ode_system, [0, 1], [0, 0], t_eval=t_eval, rtol=rtol)
+        return sol.t, sol.y[0]
+    return cached_reference("A9.problem4.ivp", compute, ode="u''=exp(sin x)",
+                            y0=[0, 0], interval=[0, 1], t_eval=np.asarray(t_eval), rtol=rtol)
+
+x_true, u_true = ivp_reference(np.linspace(0, 1, 321))
 
 # --- 3. FDM 求解 ---
 def solve_fdm_neumann_inhomogeneous(N, alpha):
     h = 1.0 / N
     x = np.linspace(0, 1, N+1)
     dim = N + 1
-    A = np.zeros((dim, dim))
-    b = np.zeros(dim)
     
-    # 內部節點
-    for i in range(1, N):
-        A[i, i-1] = 1.0
-        A[i, i]   = -2.0
-        A[i, i+1] = 1.0
-        b[i]      = (h**2) * source_f(x[i])
+    # 所有節點 (含邊界): u_{i-1} - 2u_i + u_{i+1} = h^2 f(x_i)
+    A = TriDiag(dim, 1.0, -2.0, 1.0)
+    b = (h**2) * source_f(x)
         
-    # 左邊界 i=0 (u'(0)=0)
-    # Ghost point: -2u0 + 2u1 = h^2 f(0)
-    A[0, 0] = -2.0
-    A[0, 1] = 2.0
-    b[0]    = (h**2) * source_f(x[0])
-    
-    # 右邊界 i=N (u'(1)=alpha)
-    # Ghost point: 2u_{N-1} - 2u_N = h^2 f(1) - 2h*alpha
-    A[N, N-1] = 2.0
-    A[N, N]   = -2.0
-    b[N]      = (h**2) * source_f(x[N]) - 2 * h * alpha
+    # 左邊界 i=0 (u'(0)=0)，Ghost point: -2u0 + 2u1 = h^2 f(0)
+    # 右邊界 i=N (u'(1)=alpha)，Ghost point: 2u_{N-1} - 2u_N = h^2 f(1) - 2h*alpha
+    A.neumann(b, h, left=0.0, right=alpha)
     
     # 求解奇異矩陣 (Singular Matrix)
-    # 使用 Least Squares 求解
-    u_sol, _, _, _ = np.linalg.lstsq(A, b, rcond=None)
-    
-    # 平移解：強制讓 u(0) = 0 與真值比較
-    u_sol = u_sol - u_sol[0]
+    # alpha 由 quad 算出，離散相容條件 (梯形和) 只差 O(h^2)：
+    # 投影到 range(A) (等同 least squares)，並固定 u(0) = 0 與真值比較
+    u_sol, compat = A.solve_neumann(b, u0=0.0, project=True)
+    print(f"N={N}: relative compatibility residual = {compat:.3e} (projected out)")
     
     return x, u_sol
 
@@ -61,8 +59,7 @@ def solve_fdm_neumann_inhomogeneous(N, alpha):
 N_grid = 40
 x_fdm, u_fdm = solve_fdm_neumann_inhomogeneous(N_grid, alpha_val)
 
-sol_check = solve_ivp(ode_system, [0, 1], [0, 0], t_eval=x_fdm, rtol=1e-13)
-u_true_at_nodes = sol_check.y[0]
+_, u_true_at_nodes = ivp_reference(x_fdm)
 error = u_fdm - u_true_at_nodes
 
 # --- 繪圖 ---
@@ -2,6 +2,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 
+from tridiag import TriDiag
+
 def exact_solution(x):
     # 修正後公式: 分母為相減
     numer = np.exp(-x) - np.exp(-100 * x)
@@ -15,8 +17,6 @@ def solve_sp_fdm(N, epsilon=0.01):
     # 建立矩陣系統 A u = b
     # eq: epsilon*u'' + (1+epsilon)*u' + u = 0
     dim = N - 1
-    A = np.zeros((dim, dim))
-    b = np.zeros(dim)
     
     # 係數 (使用中央差分 Central Difference)
     # u_{i-1}: epsilon/h^2 - (1+epsilon)/(2h)
@@ -27,15 +27,13 @@ def solve_sp_fdm(N, epsilon=0.01):
     c_curr = -2*epsilon/(h**2) + 1.0
     c_next = epsilon/(h**2) + (1+epsilon)/(2*h)
     
-    for i in range(dim):
-        A[i, i] = c_curr
-        if i > 0:     A[i, i-1] = c_prev
-        if i < dim-1: A[i, i+1] = c_next
+    A = TriDiag(dim, c_prev, c_curr, c_next)
+    b = np.zeros(dim)
         
     # 邊界條件 u(0)=0 (無影響), u(1)=1 (移項到 b)
-    b[dim-1] -= c_next * 1.0
+    A.dirichlet(b, left=0.0, right=1.0)
     
-    u_inner = np.linalg.solve(A, b)
+    u_inner = A.solve(b)
     u_sol = np.concatenate(([0], u_inner, [1]))
     
     return x, u_sol
@@ -0,0 +1,102 @@
+# tridiag.py
+# 三對角 FDM 系統的共用層：向量化組裝、邊界列、O(N) 求解
+# - 第 i 列: lo[i] u_{i-1} + di[i] u_i + up[i] u_{i+1} = rhs[i]
+# - Dirichlet: 已知邊界值移到右手邊 (未知數只含內部節點)
+# - Neumann (ghost point): 邊界節點也是未知數，中央差分
+#   u'(0)=g: u_{-1} = u_1 - 2h g,  u'(1)=g: u_{N+1} = u_{N-1} + 2h g
+# - 求解: scipy.linalg.solve_banded 的 (1, 1) banded 格式 (3 x n)
+# - 純 Neumann (奇異) 系統: 先檢查相容條件 w·b = 0 (w 為左零空間向量)，
+#   再固定 u_0 並解去掉第 0 列/行後的三對角系統，全部 O(N)
+
+import numpy as np
+from scipy.linalg import solve_banded
+
+class TriDiag:
+    """n x n 三對角矩陣，以三條係數向量儲存 (純量會被廣播)"""
+    def __init__(self, n, lower, diag, upper):
+        # lo[0] / up[-1] 是落在網格外的係數，留給 dirichlet / neumann 使用，
+        # 組裝 banded 時不會用到
+        self.n = n
+        self.lo = np.broadcast_to(np.asarray(lower, dtype=float), (n,)).copy()
+        self.di = np.broadcast_to(np.asarray(diag, dtype=float), (n,)).copy()
+        self.up = np.broadcast_to(np.asarray(upper, dtype=float), (n,)).copy()
+
+    def dirichlet(self, rhs, left=None, right=None):
+        """u(0)=left, u(1)=right 已知：係數乘上邊界值移到 rhs"""
+        if left is not None:
+            rhs[0] -= self.lo[0] * left
+            self.lo[0] = 0.0
+        if right is not None:
+            rhs[-1] -= self.up[-1] * right
+            self.up[-1] = 0.0
+        return rhs
+
+    def neumann(self, rhs, h, left=None, right=None):
+        """Ghost point：u'(0)=left 或 u'(1)=right (邊界節點為未知數)"""
+        if left is not None:
+            self.up[0] += self.lo[0]
+            rhs[0] += 2.0 * h * self.lo[0] * left
+            self.lo[0] = 0.0
+        if right is not None:
+            self.lo[-1] += self.up[-1]
+            rhs[-1] -= 2.0 * h * self.up[-1] * right
+            self.up[-1] = 0.0
+        return rhs
+
+    def banded(self):
+        """solve_banded((1, 1), ...) 的 3 x n 儲存"""
+        ab = np.zeros((3, self.n))
+        ab[0, 1:] = self.up[:-1]
+        ab[1] = self.di
+        ab[2, :-1] = self.lo[1:]
+        return ab
+
+    def matvec(self, u):
+        r = self.di * u
+        r[1:] += self.lo[1:] * u[:-1]
+        r[:-1] += self.up[:-1] * u[1:]
+        return r
+
+    def dense(self):
+        return np.diag(self.di) + np.diag(self.lo[1:], -1) + np.diag(self.up[:-1], 1)
+
+    def solve(self, rhs):
+        """O(n) banded LU (LAPACK gbsv)"""
+        return solve_banded((1, 1), self.banded(), rhs, overwrite_ab=True, check_finite=False)
+
+    def sub(self, k=1):
+        """去掉前 k 列/行的子矩陣"""
+        return TriDiag(self.n - k, self.lo[k:], self.di[k:], self.up[k:])
+
+    def left_null(self):
+        """A^T w = 0 的解 (w_0 = 1)，假設 A·1 = 0 (每列 lo + di + up = 0):
+        代入第 j 行得 lo[j+1] w_{j+1} - up[j] w_j 為常數 (= 0，由第 0 行)，
+        所以 w_{j+1} = w_j up[j] / lo[j+1]，一次 cumprod
+        (ghost-point Laplacian 得到精確的 [1, 2, ..., 2, 1])"""
+        return np.concatenate(([1.0], np.cumprod(self.up[:-1] / self.lo[1:])))
+
+    def solve_neumann(self, rhs, u0=0.0, rtol=1e-8, project=False):
+        """
+        奇異 (純 Neumann) 系統，零空間為常數:
+        1. 相容條件: c = w·b / (|w|·|b|)，w 為左零空間向量 (捨入誤差約 N eps)
+           |c| > rtol 時: project=True 則把 b 投影到 range(A) (與 lstsq 相同)，
+           否則丟出 ValueError 並回報殘差
+        2. 固定 u[0] = u0，解去掉第 0 列/行的三對角系統
+        回傳 (u, c)
+        """
+        rhs = np.asarray(rhs, dtype=float)
+        row_sum = self.matvec(np.ones(self.n))
+        if np.max(np.abs(row_sum)) > 1e-12 * np.max(np.abs(self.di)):
+            raise ValueError("solve_neumann: constants are not in the null space of A")
+        w = self.left_null()
+        scale = np.abs(w) @ np.abs(rhs)
+        c = (w @ rhs) / scale if scale > 0 else 0.0
+        if abs(c) > rtol:
+            if not project:
+                raise ValueError(f"Neumann data incompatible: w.b = {w @ rhs:.3e} "
+                                 f"(relative {c:.3e} > rtol = {rtol:.1e})")
+            rhs = rhs - (w @ rhs) / (w @ w) * w
+        
+        r = rhs[1:].copy()
+        r[0] -= self.lo[1] * u0
+        return np.concatenate(([u0], self.sub().solve(r))), c
@@ -5,6 +5,11 @@ import platform
 import matplotlib.font_manager as fm
 # 導入泰勒級數所需的函式
 from scipy.interpolate import approximate_taylor_polynomial
+import sys
+from pathlib import Path
+# 共用的 max-norm 估計器 (Assignment_2/maxNorm.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Assignment_2"))
+from maxNorm import sup_norm
 
 # Define the Runge function
 # ... (aaa_simple 函式和 eval_rational 函式保持不變) ...
@@ -125,9 +130,10 @@ f_approx = eval_rational(x_fine, z_support, f_support, w)
 
 # Compute pointwise error
 pointwise_error = np.abs(f_true - f_approx)
-max_error = np.max(pointwise_error)
+# sup-norm 用自適應估計 (粗網格 + golden-section)，fine grid 只用來畫圖
+max_error, _, n_ev = sup_norm(lambda x: runge(x) - eval_rational(x, z_support, f_support, w).real)
 
-print(f"\nMaximum error on fine grid (AAA): {max_error:.2e}")
+print(f"\nMaximum error (AAA, adaptive, {n_ev} evals): {max_error:.2e}")
 print(f"Rational approximation type: ({len(z_support)-1}, {len(z_support)-1})")
 
 
@@ -141,9 +147,9 @@ f_taylor = taylor_poly(x_fine)
 
 # 計算泰勒級數的誤差
 taylor_pointwise_error = np.abs(f_true - f_taylor)
-taylor_max_error = np.max(taylor_pointwise_error)
+taylor_max_error, _, n_ev = sup_norm(lambda x: runge(x) - taylor_poly(x))
 
-print(f"Maximum error on fine grid (Taylor): {taylor_max_error:.2e}")
+print(f"Maximum error (Taylor, adaptive, {n_ev} evals): {taylor_max_error:.2e}")
 print(f"Taylor polynomial degree: {degree}")
 print("\n" + "=" * 60)
 
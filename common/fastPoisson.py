@@ -0,0 +1,128 @@
+# fastPoisson.py
+# Fast Poisson solver for -Laplace(u) = f on rectangular 1-D/2-D/3-D node grids
+# (same conventions as multigrid.py: spacing h on every axis, f and u given on
+# all nodes, Dirichlet values taken from u_bdry, Neumann sides closed with the
+# ghost point u_{-1} = u_1).
+#
+# The 3-point operator on each axis is diagonalized by a sine/cosine transform,
+# chosen by that axis' boundary pair (unknowns j, eigenvalue (2 - 2 cos theta_k)/h^2):
+#   dirichlet/dirichlet  j = 1..N-1  DST-I    theta_k = k pi / N,        k = 1..N-1
+#   neumann/neumann      j = 0..N    DCT-I    theta_k = k pi / N,        k = 0..N
+#   dirichlet/neumann    j = 1..N    DST-III  theta_k = (2k+1) pi / 2N,  k = 0..N-1
+#   neumann/dirichlet    j = 0..N-1  DCT-III  theta_k = (2k+1) pi / 2N,  k = 0..N-1
+# Forward transform along every axis, divide by the eigenvalue sums, inverse
+# transform: O(N^d log N). The unnormalized scipy transforms are V^T D with the
+# ghost-point row scaling D, so T^{-1} Lambda^{-1} T is exactly A^{-1}.
+
+import numpy as np
+from scipy import fft
+
+from multigrid import apply_operator, normalize_bc, trapezoid_weights
+
+_TRANSFORMS = {
+    ("dirichlet", "dirichlet"): (fft.dst, fft.idst, 1, slice(1, -1)),
+    ("neumann", "neumann"):     (fft.dct, fft.idct, 1, slice(None)),
+    ("dirichlet", "neumann"):   (fft.dst, fft.idst, 3, slice(1, None)),
+    ("neumann", "dirichlet"):   (fft.dct, fft.idct, 3, slice(None, -1)),
+}
+
+def eigenvalues(n_intervals, h, sides):
+    """Eigenvalues of the 1-D ghost-point operator for one axis, in transform order."""
+    N = n_intervals
+    if sides == ("dirichlet", "dirichlet"):
+        theta = np.arange(1, N) * np.pi / N
+    elif sides == ("neumann", "neumann"):
+        theta = np.arange(N + 1) * np.pi / N
+    else:
+        theta = (2 * np.arange(N) + 1) * np.pi / (2 * N)
+    return (2.0 * np.sin(0.5 * theta) / h) ** 2      # = (2 - 2 cos theta)/h^2 without cancellation
+
+def poisson_solve(f, h, bc="dirichlet", u_bdry=None, workers=None, rtol=1e-8, project=False):
+    """
+    Solve -Laplace(u) = f on the node grid of f; returns u on all nodes.
+    u_bdry: array on the same grid holding the Dirichlet values (default 0).
+    workers: passed to scipy.fft (None = 1 thread, -1 = all cores).
+    All-Neumann problems: the trapezoid-weighted mean of f must vanish (relative
+    to rtol) unless project=True; u is returned with zero weighted mean.
+    """
+    f = np.asarray(f, dtype=float)
+    d = f.ndim
+    bc = normalize_bc(bc, d)
+    singular = all(s == "neumann" for p in bc for s in p)
+
+    # Dirichlet data -> right-hand side of the neighbouring unknowns
+    unknown = tuple(_TRANSFORMS[sides][3] for sides in bc)
+    u = np.zeros(f.shape) if u_bdry is None else np.array(u_bdry, dtype=float)
+    mask = np.ones(f.shape, dtype=bool)
+    mask[unknown] = False
+    g = np.where(mask, u, 0.0)
+    rhs = (f - apply_operator(g, h))[unknown] if g.any() else f[unknown]
+
+    if singular:
+        w = trapezoid_weights(f.shape)
+        c = np.sum(w * rhs) / np.sum(np.abs(w * rhs)) if rhs.any() else 0.0
+        if abs(c) > rtol and not project:
+            raise ValueError(f"Neumann data incompatible: relative weighted mean of f "
+                             f"= {c:.3e} > rtol = {rtol:.1e}")
+
+    # forward transforms, divide by eigenvalue sums, inverse transforms
+    lam = np.zeros(rhs.shape)
+    for ax, sides in enumerate(bc):
+        fwd, _, kind, _ = _TRANSFORMS[sides]
+        rhs = fwd(rhs, type=kind, axis=ax, workers=workers)
+        shape = [1] * d
+        shape[ax] = -1
+        lam = lam + eigenvalues(f.shape[ax] - 1, h, sides).reshape(shape)
+    if singular:
+        lam.flat[0] = 1.0
+        rhs.flat[0] = 0.0                # zero weighted mean (k = 0 mode)
+    rhs /= lam
+    for ax, sides in enumerate(bc):
+        _, inv, kind, _ = _TRANSFORMS[sides]
+        rhs = inv(rhs, type=kind, axis=ax, workers=workers)
+
+    u[unknown] = rhs
+    return u
+
+def main():
+    import time
+    from multigrid import mg_solve
+
+    print("=== Fast Poisson solver (DST / DCT) ===")
+    print(f"\n{'grid':>10} | {'bc':>9} | {'time (s)':>8} | {'max error':>10} | {'||r|| / ||f||':>12}")
+    for N, bc, exact, lap in [
+        (1024, "dirichlet", lambda X, Y: np.sin(np.pi * X) * np.sin(2 * np.pi * Y), 5 * np.pi ** 2),
+        (1024, "neumann", lambda X, Y: np.cos(np.pi * X) * np.cos(2 * np.pi * Y), 5 * np.pi ** 2),
+        (1024, [("dirichlet", "neumann"), ("neumann", "dirichlet")],
+         lambda X, Y: np.sin(np.pi * X / 2) * np.cos(np.pi * Y / 2), np.pi ** 2 / 2),
+    ]:
+        x = np.linspace(0, 1, N + 1)
+        X, Y = np.meshgrid(x, x, indexing="ij")
+        ue = exact(X, Y)
+        f = lap * ue
+        t0 = time.perf_counter()
+        u = poisson_solve(f, 1.0 / N, bc, workers=-1)
+        elapsed = time.perf_counter() - t0
+        r = f - apply_operator(u, 1.0 / N)
+        r = r[tuple(_TRANSFORMS[s][3] for s in normalize_bc(bc, 2))]
+        name = bc if isinstance(bc, str) else "mixed"
+        print(f"{f'{N}^2':>10} | {name:>9} | {elapsed:8.3f} | {np.max(np.abs(u - ue)):10.3e} | "
+              f"{np.linalg.norm(r) / np.linalg.norm(f):12.3e}")
+
+    # 3-D Dirichlet, compared with multigrid
+    N = 128
+    x = np.linspace(0, 1, N + 1)
+    X, Y, Z = np.meshgrid(x, x, x, indexing="ij")
+    ue = np.sin(np.pi * X) * np.sin(np.pi * Y) * np.sin(np.pi * Z)
+    f = 3 * np.pi ** 2 * ue
+    t0 = time.perf_counter()
+    u = poisson_solve(f, 1.0 / N, workers=-1)
+    t_fft = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    u_mg, _ = mg_solve(f, 1.0 / N, cycle="fmg")
+    t_mg = time.perf_counter() - t0
+    print(f"\n{N}^3 Dirichlet: DST {t_fft:.3f} s, multigrid {t_mg:.3f} s, "
+          f"max|u_dst - u_mg| = {np.max(np.abs(u - u_mg)):.2e}, max error = {np.max(np.abs(u - ue)):.3e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+# multigrid.py
+# Geometric multigrid for -Laplace(u) = f on [0, L]^d (d = 1, 2, 3), vertex-centred
+# grids with the same spacing h on every axis.
+#
+#   u, hist = mg_solve(f, h, bc="dirichlet", u0=g_on_boundary, cycle="fmg")
+#
+# - unknowns live on all (N+1)^d nodes; Dirichlet boundary nodes keep the
+#   values given in u0 (zero by default), Neumann boundary nodes are unknowns
+#   closed with the ghost point u_{-1} = u_1 (reflection). Inhomogeneous flux
+#   du/dn = g goes into the right-hand side as f + 2 g / h on that boundary.
+# - bc: "dirichlet" / "neumann" for every side, or one (left, right) pair per axis
+# - all-Neumann problems are singular: f is projected onto the compatible
+#   subspace (trapezoid-weighted mean removed) and u is returned with zero mean
+# - smoothers: red-black Gauss-Seidel ("rbgs", strided sub-lattice updates in a
+#   ghost-padded copy) or weighted Jacobi ("jacobi");
+#   full-weighting restriction, (multi)linear prolongation; coarsening stops when
+#   an axis has 3 nodes (or an odd number of intervals), then a sparse LU solve
+#   (factors cached per level); the coarsest grid may have at most MAX_COARSE
+#   nodes, so N should be m 2^k with small m (N = 500 -> 126 intervals is fine)
+# - every cycle records the residual norm, so the per-cycle reduction factor
+#   can be checked for h-independence
+
+from itertools import product
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+MAX_COARSE = 1 << 16   # nodes allowed on the coarsest grid (sparse direct solve)
+
+_masks = {}            # cached (active, red) masks per (shape, bc)
+_rb_plans = {}         # cached red/black sub-lattice slices per (shape, bc)
+_coarse = {}           # cached (unknowns, LU factors) per (shape, h, bc)
+
+def _sl(ndim, axis, s):
+    idx = [slice(None)] * ndim
+    idx[axis] = s
+    return tuple(idx)
+
+def normalize_bc(bc, ndim):
+    """bc -> ((left, right), ...) per axis, each side 'dirichlet' or 'neumann'."""
+    if isinstance(bc, str):
+        bc = [(bc, bc)] * ndim
+    bc = tuple((str(lo).lower(), str(hi).lower()) for lo, hi in bc)
+    if len(bc) != ndim or any(s not in ("dirichlet", "neumann") for p in bc for s in p):
+        raise ValueError(f"bc must give 'dirichlet'/'neumann' for both sides of {ndim} axes")
+    return bc
+
+def _level_masks(shape, bc):
+    key = (shape, bc)
+    if key not in _masks:
+        active = np.ones(shape, dtype=bool)
+        for ax, (lo, hi) in enumerate(bc):
+            if lo == "dirichlet":
+                active[_sl(len(shape), ax, 0)] = False
+            if hi == "dirichlet":
+                active[_sl(len(shape), ax, -1)] = False
+        red = np.add.reduce(np.indices(shape), axis=0) % 2 == 0
+        _masks[key] = (active, active & red, active & ~red)
+    return _masks[key]
+
+def trapezoid_weights(shape):
+    """Left null vector of the ghost-point Neumann operator (tensor trapezoid weights)."""
+    w = np.ones(shape)
+    for ax, n in enumerate(shape):
+        w1 = np.ones(n)
+        w1[0] = w1[-1] = 0.5
+        w = w * w1.reshape([-1 if a == ax else 1 for a in range(len(shape))])
+    return w
+
+def _neighbour_sum(u):
+    """Sum of the 2d neighbours, mirrored across every boundary (ghost u_{-1} = u_1)."""
+    p = np.pad(u, 1, mode="reflect")
+    inner = [slice(1, -1)] * u.ndim
+    s = np.zeros_like(u)
+    for ax in range(u.ndim):
+        for sl in (slice(None, -2), slice(2, None)):
+            idx = list(inner)
+            idx[ax] = sl
+            s += p[tuple(idx)]
+    return s
+
+def _rb_plan(shape, bc):
+    """
+    Red-black sweep plan: each colour is a union of 2^(d-1) strided sub-lattices
+    (one per index-parity pattern). The active nodes form a box (Dirichlet
+    faces removed), so each sub-lattice is clipped to it; per sub-lattice the
+    plan holds its slice of u and the slices of its 2d neighbours in the
+    ghost-padded array.
+    """
+    key = (shape, bc)
+    if key not in _rb_plans:
+        box = [(int(lo == "dirichlet"), n - 1 - int(hi == "dirichlet"))
+               for n, (lo, hi) in zip(shape, bc)]
+        plan = ([], [])
+        for par in product((0, 1), repeat=len(shape)):
+            first = [lo + (q - lo) % 2 for q, (lo, _) in zip(par, box)]
+            m = [len(range(i0, hi + 1, 2)) for i0, (_, hi) in zip(first, box)]
+            if 0 in m:
+                continue
+            sub = tuple(slice(i0, i0 + 2 * mm - 1, 2) for i0, mm in zip(first, m))
+            # padded index = u index + 1; neighbours along ax are at offsets 0 and 2
+            nbrs = [tuple(slice(i0 + (off if a == ax else 1),
+                                i0 + (off if a == ax else 1) + 2 * mm - 1, 2)
+                          for a, (i0, mm) in enumerate(zip(first, m)))
+                    for ax in range(len(shape)) for off in (0, 2)]
+            plan[sum(par) % 2].append((sub, nbrs))
+        _rb_plans[key] = plan
+    return _rb_plans[key]
+
+def apply_operator(u, h):
+    """-Laplace(u) with the ghost-point closure at every boundary node."""
+    return (2 * u.ndim * u - _neighbour_sum(u)) / (h * h)
+
+def residual(u, f, h, bc):
+    r = f - apply_operator(u, h)
+    r[~_level_masks(u.shape, bc)[0]] = 0.0
+    return r
+
+def smooth(u, f, h, bc, sweeps=1, method="rbgs", omega=None):
+    """In-place relaxation on the active (non-Dirichlet) nodes."""
+    active = _level_masks(u.shape, bc)[0]
+    d2 = 2 * u.ndim
+    if method == "rbgs":
+        # work in a ghost-padded copy; each colour updates its strided sub-lattices
+        # from strided neighbour slices, then the ghost faces are re-mirrored
+        U = np.pad(u, 1, mode="reflect")
+        V = U[(slice(1, -1),) * u.ndim]
+        hhf = h * h * f
+        for _ in range(sweeps):
+            for colour in _rb_plan(u.shape, bc):
+                for sub, nbrs in colour:
+                    s = hhf[sub].copy()
+                    for nb in nbrs:
+                        s += U[nb]
+                    s /= d2
+                    V[sub] = s
+                for ax in range(u.ndim):
+                    U[_sl(u.ndim, ax, 0)] = U[_sl(u.ndim, ax, 2)]
+                    U[_sl(u.ndim, ax, -1)] = U[_sl(u.ndim, ax, -3)]
+        u[...] = V
+    elif method == "jacobi":
+        w = 2 * u.ndim / (2 * u.ndim + 1) if omega is None else omega    # 2/3 in 1-D, 4/5 in 2-D
+        for _ in range(sweeps):
+            u[active] += (w * h * h / d2) * residual(u, f, h, bc)[active]
+    else:
+        raise ValueError("method must be 'rbgs' or 'jacobi'")
+    return u
+
+def restrict(r):
+    """Full weighting [1/4, 1/2, 1/4] per axis onto every second node (mirror at the ends)."""
+    for ax in range(r.ndim):
+        p = np.pad(r, [(1, 1) if a == ax else (0, 0) for a in range(r.ndim)], mode="reflect")
+        r = (0.25 * p[_sl(r.ndim, ax, slice(0, -2, 2))] + 0.5 * p[_sl(r.ndim, ax, slice(1, -1, 2))]
+             + 0.25 * p[_sl(r.ndim, ax, slice(2, None, 2))])
+    return r
+
+def prolong(e):
+    """Linear interpolation per axis onto the twice-finer grid."""
+    for ax in range(e.ndim):
+        shape = list(e.shape)
+        shape[ax] = 2 * shape[ax] - 1
+        fine = np.empty(shape)
+        fine[_sl(e.ndim, ax, slice(0, None, 2))] = e
+        fine[_sl(e.ndim, ax, slice(1, None, 2))] = 0.5 * (e[_sl(e.ndim, ax, slice(None, -1))]
+                                                          + e[_sl(e.ndim, ax, slice(1, None))])
+        e = fine
+    return e
+
+def _coarsenable(shape):
+    return all((n - 1) % 2 == 0 and n > 3 for n in shape)
+
+def coarsest_shape(shape):
+    """Grid shape at which coarsening stops."""
+    shape = tuple(shape)
+    while _coarsenable(shape):
+        shape = tuple((n - 1) // 2 + 1 for n in shape)
+    return shape
+
+def _singular(bc):
+    return all(s == "neumann" for p in bc for s in p)
+
+def _project(f, bc):
+    """Remove the incompatible component of f (only for all-Neumann problems)."""
+    if _singular(bc):
+        w = trapezoid_weights(f.shape)
+        f = f - np.sum(w * f) / np.sum(w)
+    return f
+
+def _zero_mean(u, bc):
+    if _singular(bc):
+        w = trapezoid_weights(u.shape)
+        u -= np.sum(w * u) / np.sum(w)
+    return u
+
+def _operator_1d(n):
+    """1-D ghost-point operator times h^2 on all n nodes: [-1, 2, -1], -2 next to the ends."""
+    T = sparse.diags([-np.ones(n - 1), 2.0 * np.ones(n), -np.ones(n - 1)], [-1, 0, 1], format="lil")
+    T[0, 1] = T[-1, -2] = -2.0
+    return T.tocsr()
+
+def coarse_solve(u, f, h, bc):
+    """Sparse direct solve on the coarsest grid (LU factors cached per level)."""
+    key = (u.shape, h, bc)
+    if key not in _coarse:
+        A = sparse.csr_matrix((u.size, u.size))
+        for ax, n in enumerate(u.shape):
+            before, after = int(np.prod(u.shape[:ax])), int(np.prod(u.shape[ax + 1:]))
+            A = A + sparse.kron(sparse.identity(before),
+                                sparse.kron(_operator_1d(n), sparse.identity(after)))
+        idx = np.flatnonzero(_level_masks(u.shape, bc)[0])
+        if _singular(bc):
+            idx = idx[1:]         # pin one node; its equation follows from compatibility
+        _coarse[key] = (idx, splu(sparse.csc_matrix(A[idx][:, idx]) / (h * h)))
+    idx, lu = _coarse[key]
+    u.flat[idx] += lu.solve(residual(u, f, h, bc).ravel()[idx])
+    return _zero_mean(u, bc)
+
+def v_cycle(u, f, h, bc, nu1=2, nu2=2, smoother="rbgs"):
+    """One V(nu1, nu2) cycle, in place."""
+    if not _coarsenable(u.shape):
+        return coarse_solve(u, f, h, bc)
+    smooth(u, f, h, bc, nu1, smoother)
+    rc = _project(restrict(residual(u, f, h, bc)), bc)
+    ec = v_cycle(np.zeros(rc.shape), rc, 2 * h, bc, nu1, nu2, smoother)
+    u += prolong(ec)              # Dirichlet nodes: ec = 0 there, so u keeps its values
+    smooth(u, f, h, bc, nu2, smoother)
+    return u
+
+def fmg(f, h, bc, u0=None, nu1=2, nu2=2, smoother="rbgs", cycles=1):
+    """Full multigrid: solve on the coarsest grid, interpolate up, `cycles` V-cycles per level."""
+    u0 = np.zeros(f.shape) if u0 is None else u0
+    if not _coarsenable(f.shape):
+        return coarse_solve(u0.copy(), f, h, bc)
+    fc = _project(restrict(f), bc)
+    uc = fmg(fc, 2 * h, bc, u0[tuple(slice(None, None, 2) for _ in f.shape)], nu1, nu2,
+             smoother, cycles)
+    u = prolong(uc)
+    active = _level_masks(u.shape, bc)[0]
+    u[~active] = u0[~active]      # exact Dirichlet data on the fine grid
+    for _ in range(cycles):
+        v_cycle(u, f, h, bc, nu1, nu2, smoother)
+    return _zero_mean(u, bc)
+
+def mg_solve(f, h, bc="dirichlet", u0=None, cycle="v", smoother="rbgs", nu1=2, nu2=2,
+             tol=1e-10, max_cycles=50, verbose=False):
+    """
+    Solve -Laplace(u) = f on the node grid of f (spacing h).
+    cycle="v": V-cycles from u0; cycle="fmg": one FMG pass, then V-cycles.
+    Stops when ||r||_2 <= tol * ||f||_2 (norms over the active nodes), or when the
+    residual reaches its rounding floor ~ 8 d eps max|u| / h^2 (relevant in 1-D,
+    where the floor passes 1e-10 ||f|| already at N ~ 10^4).
+    Returns u and the residual-norm history (entry 0 = before the first cycle).
+    """
+    f = np.asarray(f, dtype=float)
+    bc = normalize_bc(bc, f.ndim)
+    cs = coarsest_shape(f.shape)
+    if np.prod(cs) > MAX_COARSE:
+        raise ValueError(f"coarsest grid {cs} has more than MAX_COARSE = {MAX_COARSE} nodes; "
+                         f"use N = m 2^k intervals with small m")
+    f = _project(f, bc)
+    u = np.zeros(f.shape) if u0 is None else np.array(u0, dtype=float)
+    active = _level_masks(f.shape, bc)[0]
+    norm = lambda r: np.sqrt(np.mean(r[active] ** 2))
+    stop = tol * max(norm(f), np.finfo(float).tiny)
+
+    hist = [norm(residual(u, f, h, bc))]
+    if cycle == "fmg":
+        u = fmg(f, h, bc, u, nu1, nu2, smoother)
+        hist.append(norm(residual(u, f, h, bc)))
+    elif cycle != "v":
+        raise ValueError("cycle must be 'v' or 'fmg'")
+    floor = lambda: 8 * f.ndim * np.finfo(float).eps * np.max(np.abs(u)) / (h * h)
+    while hist[-1] > max(stop, floor()) and len(hist) <= max_cycles:
+        v_cycle(u, f, h, bc, nu1, nu2, smoother)
+        _zero_mean(u, bc)
+        hist.append(norm(residual(u, f, h, bc)))
+        if verbose:
+            print(f"  cycle {len(hist)-1:2d}: ||r|| = {hist[-1]:.3e}, "
+                  f"factor = {hist[-1] / hist[-2]:.3f}")
+    return u, hist
+
+def convergence_factor(hist):
+    """Geometric-mean residual reduction per cycle (first cycle skipped)."""
+    h = np.asarray(hist[1:])
+    h = h[h > 0]
+    return (h[-1] / h[0]) ** (1.0 / (len(h) - 1)) if len(h) > 1 else np.nan
+
+def main():
+    print("=== Geometric multigrid for -Laplace(u) = f ===")
+
+    # 1-D: -u'' = exp(sin x), u(0) = u(1) = 0 (Assignment_7 BVP)
+    print("\n1-D Dirichlet, -u'' = exp(sin x)")
+    print(f"{'N':>8} | {'smoother':>8} | {'cycles':>6} | {'factor':>6}")
+    for N in [2**10, 2**14, 2**18]:
+        x = np.linspace(0, 1, N + 1)
+        for sm in ["rbgs", "jacobi"]:
+            u, hist = mg_solve(np.exp(np.sin(x)), 1.0 / N, "dirichlet", smoother=sm)
+            cf = convergence_factor(hist)     # RB-GS V-cycle is exact in 1-D: one cycle
+            print(f"{N:8d} | {sm:>8} | {len(hist)-1:6d} | " + (f"{cf:6.3f}" if np.isfinite(cf) else "     -"))
+
+    # 2-D Dirichlet: u = sin(pi x) sin(2 pi y)
+    print("\n2-D Dirichlet, u = sin(pi x) sin(2 pi y)")
+    print(f"{'N':>8} | {'cycle':>6} | {'cycles':>6} | {'factor':>6} | {'max error':>10}")
+    for N in [64, 256, 1024]:
+        x = np.linspace(0, 1, N + 1)
+        X, Y = np.meshgrid(x, x, indexing="ij")
+        exact = np.sin(np.pi * X) * np.sin(2 * np.pi * Y)
+        f = 5 * np.pi ** 2 * exact
+        for cyc in ["v", "fmg"]:
+            u, hist = mg_solve(f, 1.0 / N, "dirichlet", cycle=cyc)
+            print(f"{N:8d} | {cyc:>6} | {len(hist)-1:6d} | {convergence_factor(hist):6.3f} | "
+                  f"{np.max(np.abs(u - exact)):10.3e}")
+
+    # 2-D pure Neumann: u = cos(pi x) cos(pi y) (zero mean)
+    print("\n2-D Neumann, u = cos(pi x) cos(pi y)")
+    print(f"{'N':>8} | {'cycles':>6} | {'factor':>6} | {'max error':>10}")
+    for N in [64, 256, 1024]:
+        x = np.linspace(0, 1, N + 1)
+        X, Y = np.meshgrid(x, x, indexing="ij")
+        exact = np.cos(np.pi * X) * np.cos(np.pi * Y)
+        u, hist = mg_solve(2 * np.pi ** 2 * exact, 1.0 / N, "neumann")
+        err = u - exact
+        err -= np.sum(trapezoid_weights(u.shape) * err) / N ** 2
+        print(f"{N:8d} | {len(hist)-1:6d} | {convergence_factor(hist):6.3f} | "
+              f"{np.max(np.abs(err)):10.3e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# refCache.py
+# Persistent on-disk cache for expensive reference values (high-precision
+# integrals, fine-grid / tight-tolerance reference solutions, ...).
+#
+#   value = cached_reference("A4.problem2.I_true", compute,
+#                            integrand="log(x)/(1+25x^2)", interval=[0, 1], dps=70)
+#
+# The key is the name plus every keyword (problem identity, parameters,
+# interval or grid, precision); arrays in the key are hashed by content.
+# Entries are .npz files written atomically (temp file + os.replace), so
+# several processes may compute and store the same entry at once.
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+CACHE_DIR = Path(os.environ.get("ISC_REFCACHE", Path(__file__).with_name(".cache") / "refs"))
+
+def _canon(v):
+    """JSON-able canonical form of a key value (arrays by shape/dtype/content hash)."""
+    if isinstance(v, np.ndarray):
+        a = np.ascontiguousarray(v)
+        return {"shape": list(a.shape), "dtype": str(a.dtype),
+                "sha1": hashlib.sha1(a.tobytes()).hexdigest()}
+    if isinstance(v, (list, tuple)):
+        return [_canon(x) for x in v]
+    if isinstance(v, dict):
+        return {str(k): _canon(x) for k, x in v.items()}
+    if isinstance(v, (np.floating, np.integer)):
+        return v.item()
+    if isinstance(v, (str, int, float, bool)) or v is None:
+        return v
+    return repr(v)
+
+def _path(name: str, key: dict) -> Path:
+    text = json.dumps({"name": name, "key": _canon(key)}, sort_keys=True)
+    digest = hashlib.sha256(text.encode()).hexdigest()[:20]
+    return CACHE_DIR / f"{name}-{digest}.npz"
+
+def _save(path: Path, value):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(value, tuple):
+        arrays = {f"v{i}": np.asarray(x) for i, x in enumerate(value)}
+        arrays["tuple"] = np.array(len(value))
+    else:
+        arrays = {"v0": np.asarray(value)}
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            np.savez(fh, **arrays)
+        os.replace(tmp, path)       # atomic: readers see the old file or the whole new one
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def _load(path: Path):
+    with np.load(path) as z:
+        if "tuple" in z:
+            return tuple(z[f"v{i}"] for i in range(int(z["tuple"])))
+        v = z["v0"]
+        return v.item() if v.ndim == 0 else v
+
+def cached_reference(name: str, compute, refresh=False, **key):
+    """
+    Return compute() for (name, key), from disk when available.
+    compute may return an array, a float/str scalar (use str for mpmath
+    values to keep every digit) or a tuple of those.
+    refresh=True recomputes and overwrites the stored entry.
+    """
+    path = _path(name, key)
+    if not refresh:
+        try:
+            return _load(path)
+        except (OSError, ValueError, KeyError):
+            pass                    # missing or unreadable -> recompute
+    value = compute()
+    _save(path, value)
+    return value
+
+def invalidate(name=None, **key) -> int:
+    """
+    Delete cached entries: one entry (name + key), every entry of `name`
+    (no key), or everything (no name). Returns the number of files removed.
+    """
+    if name is not None and key:
+        paths = [_path(name, key)]
+    else:
+        paths = CACHE_DIR.glob("*.npz" if name is None else f"{name}-*.npz")
+    n = 0
+    for p in paths:
+        try:
+            p.unlink()
+            n += 1
+        except FileNotFoundError:
+            pass
+    return n